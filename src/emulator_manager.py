@@ -3,9 +3,10 @@
 import subprocess
 import json
 import re
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -53,9 +54,13 @@ class EmulatorManager:
         self.config = config
         self.logger = get_logger()
         self.instances: Dict[str, EmulatorInstance] = {}
+        # Bumped whenever an instance is added, removed, renamed or changes pid
+        self.instances_version = 0
         self._next_port = 5554
         self._avd_dir = Path.home() / ".android" / "avd"
         self._state_file = Path.home() / ".android_multi_emulator" / "instances.json"
+        # Serializes state file writes and instances_version bumps when emulators are started concurrently
+        self._save_lock = threading.Lock()
         self._load_instances()
     
     def _run_command(self, cmd: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
@@ -101,21 +106,28 @@ class EmulatorManager:
         except Exception as e:
             self.logger.error(f"Failed to load instances from {self._state_file}: {e}")
     
+    def _bump_instances_version(self) -> None:
+        """Mark the instance set as changed; safe to call from parallel starts"""
+        with self._save_lock:
+            self.instances_version += 1
+    
     def _save_instances(self) -> None:
         """Save current instances to disk"""
         try:
             # Ensure directory exists
             self._state_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Convert instances to dict
-            data = {
-                'instances': [inst.to_dict() for inst in self.instances.values()]
-            }
-            
-            with open(self._state_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            with self._save_lock:
+                # Convert instances to dict
+                instances = list(self.instances.values())
+                data = {
+                    'instances': [inst.to_dict() for inst in instances]
+                }
+                
+                with open(self._state_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
             
-            self.logger.debug(f"Saved {len(self.instances)} instance(s) to {self._state_file}")
+            self.logger.debug(f"Saved {len(instances)} instance(s) to {self._state_file}")
         except Exception as e:
             self.logger.error(f"Failed to save instances to {self._state_file}: {e}")
     
@@ -436,6 +448,7 @@ class EmulatorManager:
             return None
         
         self.instances[instance_name] = instance
+        self._bump_instances_version()
         self._save_instances()  # Persist the new instance
         return instance
     
@@ -526,11 +539,101 @@ class EmulatorManager:
         
         instance.state = EmulatorState.STOPPED
         instance.pid = None  # Clear PID since it's no longer running
+        self._bump_instances_version()
         # Keep instance in dictionary so it persists and can be restarted
         self._save_instances()  # Persist the state change
         self.logger.info(f"Emulator '{instance_name}' stopped successfully")
         return True
-    
+
+    def stop_emulators(self, instance_names: List[str],
+                       progress_callback: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """Stop several emulator instances at once
+
+        All ADB kill commands are spawned up front and reaped in a single pass,
+        so shutdown time no longer grows with one process spawn per instance.
+        progress_callback is called with (count, name) as each kill completes.
+        Returns the names of the instances that were stopped.
+        """
+        instances = []
+        for name in instance_names:
+            instance = self.instances.get(name)
+            if instance:
+                instances.append(instance)
+            else:
+                self.logger.warning(f"Cannot stop emulator '{name}': instance not found")
+
+        if not instances:
+            return []
+
+        self.logger.info(f"Stopping {len(instances)} emulator(s)")
+
+        # Try graceful shutdown via ADB, dispatching every kill before waiting on any
+        adb_path = self.config.adb_path
+        kill_commands = []
+        if adb_path:
+            for instance in instances:
+                if not instance.device_id:
+                    continue
+                self.logger.debug(f"Sending ADB kill command to {instance.device_id}")
+                try:
+                    process = subprocess.Popen(
+                        [adb_path, "-s", instance.device_id, "emu", "kill"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                    )
+                    kill_commands.append((instance, process))
+                except Exception as e:
+                    self.logger.warning(f"Failed to send ADB kill command to {instance.device_id}: {e}")
+
+        # One shared 30 s budget, so hung kills cannot add up to N x 30 s
+        deadline = time.monotonic() + 30
+        for i, (instance, process) in enumerate(kill_commands, 1):
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+            if progress_callback:
+                progress_callback(i, instance.name)
+
+        # Force kill whatever is still running
+        import psutil
+        processes = []
+        for instance in instances:
+            if not instance.pid:
+                continue
+            try:
+                process = psutil.Process(instance.pid)
+                process.terminate()
+                processes.append(process)
+            except psutil.NoSuchProcess:
+                self.logger.debug(f"Emulator process {instance.pid} already terminated")
+            except psutil.AccessDenied:
+                self.logger.warning(f"Access denied when trying to stop process {instance.pid}")
+
+        _, alive = psutil.wait_procs(processes, timeout=5)
+        for process in alive:
+            try:
+                process.kill()
+                self.logger.debug(f"Emulator process {process.pid} force killed")
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied:
+                self.logger.warning(f"Access denied when trying to kill process {process.pid}")
+
+        for instance in instances:
+            instance.state = EmulatorState.STOPPED
+            instance.pid = None
+        self._bump_instances_version()
+        self._save_instances()
+
+        if progress_callback and len(kill_commands) < len(instances):
+            progress_callback(len(instances), instances[-1].name)
+
+        stopped = [instance.name for instance in instances]
+        self.logger.info(f"Stopped {len(stopped)} emulator(s)")
+        return stopped
+
     def refresh_instances(self) -> None:
         """Refresh emulator instance states and discover new running emulators"""
         adb_path = self.config.adb_path
@@ -601,6 +704,7 @@ class EmulatorManager:
                     device_id=device_id
                 )
                 self.instances[instance_name] = new_instance
+                self._bump_instances_version()
                 self.logger.info(f"Discovered running emulator on port {port}: {instance_name}")
     
     def get_instance(self, instance_name: str) -> Optional[EmulatorInstance]:
@@ -648,6 +752,7 @@ class EmulatorManager:
         instance.name = new_name
         self.instances[new_name] = instance
         del self.instances[old_name]
+        self._bump_instances_version()
         
         # Persist the change
         self._save_instances()
@@ -685,6 +790,7 @@ class EmulatorManager:
         
         # Remove from instances dictionary
         del self.instances[instance_name]
+        self._bump_instances_version()
         self._save_instances()
         self.logger.info(f"Deleted instance '{instance_name}'")
         return True
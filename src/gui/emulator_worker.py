@@ -1,7 +1,8 @@
 """Background worker thread for emulator operations"""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtCore import QThread, pyqtSignal
-from typing import Optional
+from typing import List, Optional
 
 from ..emulator_manager import EmulatorManager, EmulatorInstance
 
@@ -58,3 +59,57 @@ class EmulatorCreationWorker(QThread):
         except Exception as e:
             self.error.emit(f"Error creating emulator: {str(e)}")
             self.finished.emit(None)
+
+
+class ShutdownWorker(QThread):
+    """Worker thread for stopping emulators (Stop All, exit) without pumping the UI event loop"""
+    
+    progress = pyqtSignal(int, str)  # Emits (stopped count, instance name)
+    finished = pyqtSignal(list)  # Emits names of the stopped instances
+    
+    def __init__(self, emulator_manager: EmulatorManager, instance_names: List[str]):
+        super().__init__()
+        self.emulator_manager = emulator_manager
+        self.instance_names = instance_names
+    
+    def run(self):
+        """Stop the emulators in background thread"""
+        try:
+            stopped = self.emulator_manager.stop_emulators(
+                self.instance_names, progress_callback=self.progress.emit
+            )
+        except Exception as e:
+            self.emulator_manager.logger.error(f"Error stopping emulators: {e}")
+            stopped = []
+        self.finished.emit(stopped)
+
+
+class StartAllWorker(QThread):
+    """Worker thread for starting several emulators side by side without blocking UI"""
+    
+    progress = pyqtSignal(int, int)  # Emits (launched count, total)
+    finished = pyqtSignal(int)  # Emits the number of emulators that started
+    
+    def __init__(self, emulator_manager: EmulatorManager, instances: List[EmulatorInstance]):
+        super().__init__()
+        self.emulator_manager = emulator_manager
+        self.instances = instances
+    
+    def run(self):
+        """Start the emulators in background thread"""
+        count = len(self.instances)
+        started = 0
+        # Each start blocks on process spawn, so launch them side by side
+        with ThreadPoolExecutor(max_workers=min(8, count)) as executor:
+            futures = [
+                executor.submit(self.emulator_manager.start_emulator, inst.avd_name, inst.name, inst.port)
+                for inst in self.instances
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    if future.result():
+                        started += 1
+                except Exception as e:
+                    self.emulator_manager.logger.error(f"Error starting emulator: {e}")
+                self.progress.emit(done, count)
+        self.finished.emit(started)
@@ -2,25 +2,26 @@
 
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTableWidget, QTableWidgetItem, QLabel, QComboBox, QCheckBox,
     QGroupBox, QMessageBox, QDialog, QLineEdit, QSpinBox, QProgressDialog,
-    QTabWidget, QSplitter, QTextEdit, QStatusBar, QMenu
+    QTabWidget, QSplitter, QTextEdit, QStatusBar, QMenu, QInputDialog,
+    QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QAction
+from PyQt6.QtCore import Qt, QTimer, QThread, QSignalBlocker, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QAction, QPixmapCache
 
 from ..config_manager import ConfigManager
 from ..emulator_manager import EmulatorManager, EmulatorInstance, EmulatorState
 from ..input_synchronizer import InputSynchronizer
 from ..logger import AppLogger, get_logger
-from .emulator_worker import EmulatorCreationWorker
+from .emulator_worker import EmulatorCreationWorker, ShutdownWorker, StartAllWorker
 from .automation_dialog import AutomationDialog
 from .settings_dialog import SettingsDialog
-from .styles import ThemeStyles, VectorIcon
+from .styles import ThemeStyles, ThemeWatcher, VectorIcon
 from .widgets import PremiumSpinBox, CollapsibleSidebar
 
 
@@ -141,28 +142,56 @@ class MainWindow(QMainWindow):
         self.emulator_manager = EmulatorManager(self.config)
         self.input_synchronizer = InputSynchronizer(self.config, self.emulator_manager)
         
+        # Snapshot of emulator instances taken once per UI refresh; menus and
+        # bulk actions read from it instead of re-listing the manager
+        self._instance_cache: Dict[str, EmulatorInstance] = {}
+        self._running_set: Set[str] = set()
+        self._stopped_set: Set[str] = set()
+        self._last_refresh_key = None
+        self._refresh_pending = False
+        
+        # Exit-time emulator shutdown state (see closeEvent)
+        self._shutdown_worker: Optional[ShutdownWorker] = None
+        self._shutdown_progress: Optional[QProgressDialog] = None
+        self._emulators_stopped = False
+        
+        # Background Start All / Stop All (see start_all_emulators, stop_all_emulators)
+        self._start_all_worker: Optional[StartAllWorker] = None
+        self._stop_all_worker: Optional[ShutdownWorker] = None
+        self._stop_all_progress: Optional[QProgressDialog] = None
+        self._close_after_stop_all = False
+        
+        # Coalesces config writes from rapid sync delay edits into one save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.config.save_config)
+        
         self.refresh_thread = EmulatorRefreshThread(self.emulator_manager)
         self.refresh_thread.refreshed.connect(self.refresh_emulator_list)
         self.refresh_thread.start()
         
+        # Follow the Windows app theme while the "auto" preference is active
+        self.theme_watcher = ThemeWatcher()
+        self.theme_watcher.theme_changed.connect(self._on_system_theme_changed)
+        self.theme_watcher.start()
+        
         # Apply Theme
-        from PyQt6.QtWidgets import QApplication
         theme_pref = self.config.get('ui.theme', 'auto')
         ThemeStyles.apply_theme(QApplication.instance(), theme_pref)
         
         self.init_ui()
         
-        # Determine theme colors for icons
-        is_dark = ThemeStyles.is_dark_mode(self.config.get('ui.theme', 'auto'))
-        self.icon_color = QColor(ThemeStyles.DARK_TEXT if is_dark else ThemeStyles.LIGHT_TEXT)
-        self.danger_color = QColor(ThemeStyles.DARK_DANGER if is_dark else ThemeStyles.LIGHT_DANGER)
-        self.accent_color = QColor(ThemeStyles.DARK_ACCENT if is_dark else ThemeStyles.LIGHT_ACCENT)
+        self._build_context_menu()
+        self.update_theme_colors()
         self.apply_icons()
         
         # Setup logging UI integration AFTER UI is initialized
         qt_handler = self.logger.get_qt_handler()
         if qt_handler and qt_handler.emitter:
-            qt_handler.emitter.log_message.connect(self.on_log_message)
+            qt_handler.emitter.log_ready.connect(self.on_log_ready)
+            # Pick up anything logged before the connection was made
+            self.on_log_ready()
         
         self.logger.info("Application started")
         
@@ -173,6 +202,78 @@ class MainWindow(QMainWindow):
         self.refresh_avd_list()
         self.refresh_emulator_list()
     
+    def _on_system_theme_changed(self, is_dark: bool):
+        """Re-apply the theme when Windows switches between light and dark"""
+        theme_pref = self.config.get('ui.theme', 'auto')
+        if theme_pref != 'auto':
+            return
+        ThemeStyles.apply_theme(QApplication.instance(), theme_pref)
+        self.update_theme_colors()
+        self.apply_icons()
+    
+    def update_theme_colors(self):
+        """Determine theme colors for icons and pre-render the context menu icons"""
+        is_dark = ThemeStyles.is_dark_mode(self.config.get('ui.theme', 'auto'))
+        self.icon_color = QColor(ThemeStyles.DARK_TEXT if is_dark else ThemeStyles.LIGHT_TEXT)
+        self.danger_color = QColor(ThemeStyles.DARK_DANGER if is_dark else ThemeStyles.LIGHT_DANGER)
+        self.accent_color = QColor(ThemeStyles.DARK_ACCENT if is_dark else ThemeStyles.LIGHT_ACCENT)
+        
+        self._icons = {
+            name: VectorIcon.get_icon(name, self.icon_color)
+            for name in ("play", "stop", "refresh", "edit", "shield", "box-arrow", "file-push", "user")
+        }
+        self._icons["trash"] = VectorIcon.get_icon("trash", self.danger_color)
+        
+        for action, icon_name in self._ctx_action_icons:
+            action.setIcon(self._icons[icon_name])
+    
+    def _build_context_menu(self):
+        """Create the emulator table context menu and its actions once"""
+        self._ctx_menu = QMenu(self)
+        
+        self._start_action = QAction("Start", self)
+        self._stop_action = QAction("Stop", self)
+        self._restart_action = QAction("Restart", self)
+        self._root_action = QAction("Root Device (RootAVD)", self)
+        self._sideload_magisk_action = QAction("Install Magisk App", self)
+        self._apk_sideload_action = QAction("Sideload APK", self)
+        self._push_file_action = QAction("Push File to Device", self)
+        self._account_setup_action = QAction("Google Account Setup", self)
+        self._rename_action = QAction("Rename", self)
+        self._delete_action = QAction("Delete", self)
+        
+        # Icons are (re)applied by update_theme_colors
+        self._ctx_action_icons = [
+            (self._start_action, "play"),
+            (self._stop_action, "stop"),
+            (self._restart_action, "refresh"),
+            (self._root_action, "shield"),
+            (self._sideload_magisk_action, "box-arrow"),
+            (self._apk_sideload_action, "box-arrow"),
+            (self._push_file_action, "file-push"),
+            (self._account_setup_action, "user"),
+            (self._rename_action, "edit"),
+            (self._delete_action, "trash"),
+        ]
+        
+        # Actions that only apply to running emulators
+        self._running_actions = [
+            self._stop_action,
+            self._restart_action,
+            self._root_action,
+            self._sideload_magisk_action,
+            self._apk_sideload_action,
+            self._push_file_action,
+            self._account_setup_action,
+        ]
+        
+        self._ctx_menu.addAction(self._start_action)
+        for action in self._running_actions:
+            self._ctx_menu.addAction(action)
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction(self._rename_action)
+        self._ctx_menu.addAction(self._delete_action)
+    
     def _validate_sdk_paths(self) -> bool:
         """Validate that Android SDK paths are configured"""
         from pathlib import Path
@@ -208,18 +309,39 @@ class MainWindow(QMainWindow):
     
     def show_settings(self):
         """Show settings dialog"""
+        # open() instead of exec() so no nested event loop blocks the refresh
+        # thread signals and log dispatch while the dialog is up
         dialog = SettingsDialog(self, self.config)
-        if dialog.exec():
-            # Reload config and reinitialize managers if paths changed
-            self.config.load_config()
-            self.emulator_manager = EmulatorManager(self.config)
-            self.input_synchronizer = InputSynchronizer(self.config, self.emulator_manager)
-            self.logger.info("Settings saved and managers reloaded")
-            # Re-apply theme in case it changed
-            from PyQt6.QtWidgets import QApplication
-            theme_pref = self.config.get('ui.theme', 'auto')
-            ThemeStyles.apply_theme(QApplication.instance(), theme_pref)
-            self.refresh_all()
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.finished.connect(self._on_settings_finished)
+        dialog.open()
+    
+    def _on_settings_finished(self, result: int):
+        """Apply saved settings once the settings dialog has closed"""
+        if result != QDialog.DialogCode.Accepted.value:
+            return
+        
+        # Reload config and reinitialize managers if paths changed
+        self.config.load_config()
+        self.emulator_manager = EmulatorManager(self.config)
+        # The old synchronizer's hooks and worker thread would otherwise outlive it
+        synced = list(self.input_synchronizer.synced_instances)
+        self.input_synchronizer.shutdown()
+        self.input_synchronizer = InputSynchronizer(self.config, self.emulator_manager)
+        # Carry an active sync over to the new synchronizer so the checkbox stays truthful
+        if self.sync_enable_checkbox.isChecked():
+            if synced:
+                self.input_synchronizer.enable_sync(synced)
+            else:
+                with QSignalBlocker(self.sync_enable_checkbox):
+                    self.sync_enable_checkbox.setChecked(False)
+        self.logger.info("Settings saved and managers reloaded")
+        # Re-apply theme in case it changed
+        theme_pref = self.config.get('ui.theme', 'auto')
+        ThemeStyles.apply_theme(QApplication.instance(), theme_pref)
+        self.update_theme_colors()
+        self.apply_icons()
+        self.refresh_all()
     
     def show_tools(self, initial_tab=0):
         """Show tools/automation dialog"""
@@ -231,12 +353,19 @@ class MainWindow(QMainWindow):
         dialog = AutomationDialog(self, self.emulator_manager, selected_instance, initial_tab)
         dialog.exec()
     
-    def on_log_message(self, message: str, level: str):
-        """Handle log message from logger"""
+    def on_log_ready(self):
+        """Append all buffered log messages to the log view in one pass"""
         # Check if log_text widget exists (UI might not be initialized yet)
         if not hasattr(self, 'log_text') or self.log_text is None:
             return
         
+        qt_handler = self.logger.get_qt_handler()
+        if not qt_handler:
+            return
+        records = qt_handler.drain()
+        if not records:
+            return
+        
         color_map = {
             'INFO': '#ffffff',
             'DEBUG': '#888888',
@@ -244,8 +373,10 @@ class MainWindow(QMainWindow):
             'ERROR': '#ff4444',
             'CRITICAL': '#ff0000'
         }
-        color = color_map.get(level, '#ffffff')
-        formatted_message = f'<span style="color: {color};">{message}</span>'
+        formatted_message = "<br>".join(
+            f'<span style="color: {color_map.get(level, "#ffffff")};">{message}</span>'
+            for message, level in records
+        )
         self.log_text.append(formatted_message)
         
         # Auto-scroll to bottom
@@ -484,9 +615,35 @@ class MainWindow(QMainWindow):
         
         self.avd_table.resizeColumnsToContents()
     
-    def refresh_emulator_list(self):
-        """Refresh the emulator instance list"""
-        instances = self.emulator_manager.list_instances()
+    def _refresh_instance_cache(self):
+        """Rebuild the instance snapshot and its state buckets from the emulator manager"""
+        self._instance_cache = {inst.name: inst for inst in self.emulator_manager.list_instances()}
+        RUNNING = EmulatorState.RUNNING
+        STOPPED = EmulatorState.STOPPED
+        self._running_set = {name for name, inst in self._instance_cache.items() if inst.state is RUNNING}
+        self._stopped_set = {name for name, inst in self._instance_cache.items() if inst.state is STOPPED}
+    
+    def refresh_emulator_list(self, force: bool = False):
+        """Refresh the emulator instance list
+        
+        The table is only rebuilt when a displayed field changed since the last
+        refresh, unless force is set.
+        """
+        self._refresh_instance_cache()
+        instances = list(self._instance_cache.values())
+        
+        # Shown even when the table is unchanged, replacing transient start/stop messages
+        running_count = sum(1 for instance in instances if instance.state == EmulatorState.RUNNING)
+        self.statusBar().showMessage(f"{running_count} emulator(s) running")
+        
+        synced = self.input_synchronizer.synced_instances
+        refresh_key = tuple(
+            (inst.name, inst.avd_name, inst.port, inst.state, inst.name in synced)
+            for inst in instances
+        )
+        if not force and refresh_key == self._last_refresh_key:
+            return
+        self._last_refresh_key = refresh_key
         self.emulator_table.setRowCount(len(instances))
         
         for row, instance in enumerate(instances):
@@ -519,8 +676,18 @@ class MainWindow(QMainWindow):
             self.emulator_table.setCellWidget(row, 4, sync_container)
         
         self.emulator_table.resizeColumnsToContents()
-        running_count = sum(1 for instance in instances if instance.state == EmulatorState.RUNNING)
-        self.statusBar().showMessage(f"{running_count} emulator(s) running")
+    
+    def _schedule_refresh(self, delay_ms: int):
+        """Refresh the emulator list after a delay, keeping at most one refresh queued"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(delay_ms, self._do_scheduled_refresh)
+    
+    def _do_scheduled_refresh(self):
+        """Run a refresh queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self.refresh_emulator_list()
     
     def refresh_all(self):
         """Refresh both lists"""
@@ -542,7 +709,7 @@ class MainWindow(QMainWindow):
             create_clone = dialog.clone_checkbox.isChecked()
             
             # Check if AVD is already running (warn if not cloning)
-            running_same_avd = [inst for inst in self.emulator_manager.list_instances()
+            running_same_avd = [inst for inst in self._instance_cache.values()
                                if inst.avd_name == avd_name and inst.state == EmulatorState.RUNNING]
             if running_same_avd and not create_clone:
                 reply = QMessageBox.question(
@@ -683,7 +850,7 @@ class MainWindow(QMainWindow):
                 self.input_synchronizer.remove_from_sync(instance_name)
                 
                 # Start (find avd name)
-                instance = self.emulator_manager.get_instance(instance_name)
+                instance = self._instance_cache.get(instance_name)
                 if instance:
                     # Small delay to ensure cleanup
                     QTimer.singleShot(1000, 
@@ -693,7 +860,7 @@ class MainWindow(QMainWindow):
             
             self.statusBar().showMessage(f"Restarting {count} emulator(s)...")
             # Refresh will happen on timer or next update
-            QTimer.singleShot(2000, self.refresh_emulator_list)
+            self._schedule_refresh(2000)
             
     def rename_selected_emulator(self):
         """Rename selected emulator"""
@@ -703,62 +870,47 @@ class MainWindow(QMainWindow):
             return
         
         old_name = names[0]
-        instance = self.emulator_manager.get_instance(old_name)
+        instance = self._instance_cache.get(old_name)
         if not instance:
             return
         
-        # Create a simple dialog for renaming
-        dialog = QDialog(self)
+        # Single-field input dialog, opened without a nested event loop
+        dialog = QInputDialog(self)
         dialog.setWindowTitle("Rename Emulator")
+        dialog.setLabelText(f"Enter new name for '{old_name}':")
+        dialog.setTextValue(old_name)
+        dialog.setOkButtonText("Rename")
         dialog.setMinimumWidth(300)
+        dialog.finished.connect(
+            lambda result: self._on_rename_finished(result, old_name, dialog.textValue())
+        )
         
-        layout = QVBoxLayout()
-        
-        label = QLabel(f"Enter new name for '{old_name}':")
-        layout.addWidget(label)
-        
-        name_input = QLineEdit()
-        name_input.setText(old_name)
-        name_input.selectAll()  # Select all for easy replacement
-        layout.addWidget(name_input)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.open()
+    
+    def _on_rename_finished(self, result: int, old_name: str, new_name: str):
+        """Apply a rename once the rename dialog has been accepted"""
+        if result != QDialog.DialogCode.Accepted.value:
+            return
         
-        button_layout = QHBoxLayout()
-        ok_btn = QPushButton("Rename")
-        cancel_btn = QPushButton("Cancel")
-        button_layout.addWidget(cancel_btn)
-        button_layout.addWidget(ok_btn)
-        layout.addLayout(button_layout)
+        new_name = new_name.strip()
+        if not new_name:
+            QMessageBox.warning(self, "Error", "Name cannot be empty.")
+            return
         
-        dialog.setLayout(layout)
+        if new_name == old_name:
+            return
         
-        def do_rename():
-            new_name = name_input.text().strip()
+        if self.emulator_manager.rename_instance(old_name, new_name):
+            # Update sync group if instance was in sync
+            if old_name in self.input_synchronizer.synced_instances:
+                self.input_synchronizer.synced_instances.discard(old_name)
+                self.input_synchronizer.synced_instances.add(new_name)
             
-            if not new_name:
-                QMessageBox.warning(self, "Error", "Name cannot be empty.")
-                return
-            
-            if new_name == old_name:
-                dialog.accept()
-                return
-            
-            if self.emulator_manager.rename_instance(old_name, new_name):
-                # Update sync group if instance was in sync
-                if old_name in self.input_synchronizer.synced_instances:
-                    self.input_synchronizer.synced_instances.discard(old_name)
-                    self.input_synchronizer.synced_instances.add(new_name)
-                
-                self.statusBar().showMessage(f"Renamed '{old_name}' to '{new_name}'")
-                self.refresh_emulator_list()
-                dialog.accept()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to rename emulator to '{new_name}'.")
-        
-        ok_btn.clicked.connect(do_rename)
-        cancel_btn.clicked.connect(dialog.reject)
-        name_input.returnPressed.connect(do_rename)
-        
-        dialog.exec()
+            self.statusBar().showMessage(f"Renamed '{old_name}' to '{new_name}'")
+            self.refresh_emulator_list(force=True)
+        else:
+            QMessageBox.critical(self, "Error", f"Failed to rename emulator to '{new_name}'.")
             
     def delete_selected_emulator(self):
         """Delete selected emulators"""
@@ -777,133 +929,157 @@ class MainWindow(QMainWindow):
                 else:
                      self.logger.warning(f"Failed to delete '{instance_name}'")
             
-            self.refresh_emulator_list()
+            self.refresh_emulator_list(force=True)
             
     def start_all_emulators(self):
         """Start all stopped emulators"""
+        STOPPED = EmulatorState.STOPPED
         stopped = [
-            inst for inst in self.emulator_manager.list_instances() 
-            if inst.state == EmulatorState.STOPPED
+            inst for inst in self._instance_cache.values()
+            if inst.state is STOPPED
         ]
         
         if not stopped:
             QMessageBox.information(self, "Info", "No stopped emulators to start.")
             return
+        if self._start_all_worker is not None:
+            QMessageBox.information(self, "Info", "Emulators are still being started.")
+            return
             
         count = len(stopped)
         if QMessageBox.question(self, "Start All", f"Start {count} stopped emulators?") == QMessageBox.StandardButton.Yes:
-            for inst in stopped:
-                self.emulator_manager.start_emulator(inst.avd_name, inst.name, inst.port)
-            
             self.statusBar().showMessage(f"Starting {count} emulators...")
-            QTimer.singleShot(1000, self.refresh_emulator_list)
+            self._start_all_worker = StartAllWorker(self.emulator_manager, stopped)
+            self._start_all_worker.progress.connect(self._on_start_all_progress)
+            self._start_all_worker.finished.connect(self._on_start_all_finished)
+            self._start_all_worker.start()
+
+    def _on_start_all_progress(self, done: int, count: int):
+        """Show Start All progress in the status bar"""
+        self.statusBar().showMessage(f"Launched {done}/{count} emulators...")
+
+    def _on_start_all_finished(self, started: int):
+        """Wrap up once every Start All launch has returned"""
+        worker = self._start_all_worker
+        worker.wait()
+        self._start_all_worker = None
+        count = len(worker.instances)
+        if started < count:
+            self.logger.warning(f"{count - started} of {count} emulators failed to start")
+        # start_emulator replaces the instance objects, so re-snapshot now
+        self._refresh_instance_cache()
+        
+        self.statusBar().showMessage(f"Started {started}/{count} emulators")
+        self._schedule_refresh(1000)
 
     def stop_all_emulators(self):
         """Stop all running emulators"""
+        RUNNING = EmulatorState.RUNNING
         running = [
-            inst for inst in self.emulator_manager.list_instances() 
-            if inst.state == EmulatorState.RUNNING
+            inst for inst in self._instance_cache.values()
+            if inst.state is RUNNING
         ]
         
         if not running:
             QMessageBox.information(self, "Info", "No running emulators to stop.")
             return
+        if self._stop_all_worker is not None:
+            return
             
         count = len(running)
         if QMessageBox.question(self, "Stop All", f"Stop all {count} running emulators?") == QMessageBox.StandardButton.Yes:
             # Show progress
             progress = QProgressDialog("Stopping all emulators...", None, 0, count, self)
             progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(0)
+            progress.setValue(0)
             progress.show()
+            self._stop_all_progress = progress
             
-            for i, inst in enumerate(running):
-                progress.setLabelText(f"Stopping {inst.name}...")
-                progress.setValue(i)
-                self.emulator_manager.stop_emulator(inst.name)
-                self.input_synchronizer.remove_from_sync(inst.name)
-            
-            progress.setValue(count)
-            self.refresh_emulator_list()
-            self.statusBar().showMessage(f"Stopped {count} emulator(s)")
+            # Stopping waits on adb and process exit, so do it off the UI thread
+            self._stop_all_worker = ShutdownWorker(self.emulator_manager, [inst.name for inst in running])
+            self._stop_all_worker.progress.connect(self._on_stop_all_progress)
+            self._stop_all_worker.finished.connect(self._on_stop_all_finished)
+            self._stop_all_worker.start()
+
+    @staticmethod
+    def _update_stop_progress(progress: Optional[QProgressDialog], done: int, name: str):
+        """Show stop progress, repainting roughly 20 times at most however many emulators are stopping"""
+        if not progress:
+            return
+        count = progress.maximum()
+        stride = max(1, count // 20)
+        if done % stride == 0 or done >= count:
+            progress.setLabelText(f"Stopped {name}")
+            progress.setValue(done)
+
+    def _on_stop_all_progress(self, done: int, name: str):
+        """Update the Stop All progress dialog from its worker"""
+        self._update_stop_progress(self._stop_all_progress, done, name)
+
+    def _on_stop_all_finished(self, stopped: List[str]):
+        """Wrap up once the Stop All worker is done"""
+        self._stop_all_worker.wait()
+        self._stop_all_worker = None
+        
+        for name in stopped:
+            self.input_synchronizer.remove_from_sync(name)
+        
+        if self._stop_all_progress:
+            self._stop_all_progress.close()
+            self._stop_all_progress = None
+        self.refresh_emulator_list()
+        self.statusBar().showMessage(f"Stopped {len(stopped)} emulator(s)")
+        
+        if self._close_after_stop_all:
+            self.close()
 
     def show_context_menu(self, position):
         """Show context menu for emulator table"""
-        menu = QMenu()
         names = self.get_selected_instances()
         
         if not names:
             return
-            
-        start_action = QAction("Start", self)
-        start_action.setIcon(VectorIcon.get_icon("play", self.icon_color))
-        stop_action = QAction("Stop", self)
-        stop_action.setIcon(VectorIcon.get_icon("stop", self.icon_color))
-        restart_action = QAction("Restart", self)
-        restart_action.setIcon(VectorIcon.get_icon("refresh", self.icon_color))
-        rename_action = QAction("Rename", self)
-        rename_action.setIcon(VectorIcon.get_icon("edit", self.icon_color))
-        delete_action = QAction("Delete", self)
-        delete_action.setIcon(VectorIcon.get_icon("trash", self.danger_color))
-        root_action = QAction("Root Device (RootAVD)", self)
-        root_action.setIcon(VectorIcon.get_icon("shield", self.icon_color))
-        sideload_magisk_action = QAction("Install Magisk App", self)
-        sideload_magisk_action.setIcon(VectorIcon.get_icon("box-arrow", self.icon_color))
-        apk_sideload_action = QAction("Sideload APK", self)
-        apk_sideload_action.setIcon(VectorIcon.get_icon("box-arrow", self.icon_color))
-        push_file_action = QAction("Push File to Device", self)
-        push_file_action.setIcon(VectorIcon.get_icon("file-push", self.icon_color))
-        account_setup_action = QAction("Google Account Setup", self)
-        account_setup_action.setIcon(VectorIcon.get_icon("user", self.icon_color))
         
         # Check states to enable/disable
-        has_running = any(self.emulator_manager.get_instance(n).state == EmulatorState.RUNNING for n in names if self.emulator_manager.get_instance(n))
-        has_stopped = any(self.emulator_manager.get_instance(n).state == EmulatorState.STOPPED for n in names if self.emulator_manager.get_instance(n))
-        
-        if has_stopped:
-            menu.addAction(start_action)
-        if has_running:
-            menu.addAction(stop_action)
-            menu.addAction(restart_action)
-            menu.addAction(root_action)
-            menu.addAction(sideload_magisk_action)
-            menu.addAction(apk_sideload_action)
-            menu.addAction(push_file_action)
-            menu.addAction(account_setup_action)
-        
-        menu.addSeparator()
+        names_set = set(names)
+        has_running = not self._running_set.isdisjoint(names_set)
+        has_stopped = not self._stopped_set.isdisjoint(names_set)
+        
+        self._start_action.setVisible(has_stopped)
+        for running_action in self._running_actions:
+            running_action.setVisible(has_running)
         # Rename action is available for single selection only
-        if len(names) == 1:
-            menu.addAction(rename_action)
-        menu.addAction(delete_action)
+        self._rename_action.setVisible(len(names) == 1)
         
-        action = menu.exec(self.emulator_table.viewport().mapToGlobal(position))
+        action = self._ctx_menu.exec(self.emulator_table.viewport().mapToGlobal(position))
         
-        if action == start_action:
+        if action is self._start_action:
             for name in names:
-                inst = self.emulator_manager.get_instance(name)
+                inst = self._instance_cache.get(name)
                 if inst and inst.state == EmulatorState.STOPPED:
                     self.emulator_manager.start_emulator(inst.avd_name, inst.name, inst.port)
             self.refresh_emulator_list()
-        elif action == stop_action:
+        elif action is self._stop_action:
             self.stop_selected_emulator()
-        elif action == restart_action:
+        elif action is self._restart_action:
             self.restart_selected_emulator()
-        elif action == rename_action:
+        elif action is self._rename_action:
             self.rename_selected_emulator()
-        elif action == delete_action:
+        elif action is self._delete_action:
             self.delete_selected_emulator()
-        elif action == root_action:
+        elif action is self._root_action:
             if len(names) == 1:
                 self.show_tools(initial_tab=0) 
             else:
                  QMessageBox.information(self, "Info", "Please select only one emulator to root.")
-        elif action == sideload_magisk_action:
+        elif action is self._sideload_magisk_action:
             self.show_tools(initial_tab=1)
-        elif action == apk_sideload_action:
+        elif action is self._apk_sideload_action:
             self.show_tools(initial_tab=2)
-        elif action == push_file_action:
+        elif action is self._push_file_action:
             self.show_tools(initial_tab=3)
-        elif action == account_setup_action:
+        elif action is self._account_setup_action:
             self.show_tools(initial_tab=4)
     
 
@@ -912,15 +1088,18 @@ class MainWindow(QMainWindow):
         """Toggle input synchronization"""
         if state == Qt.CheckState.Checked.value or state == 2:
             # Get all running instances
+            RUNNING = EmulatorState.RUNNING
             running_instances = [
-                inst.name for inst in self.emulator_manager.list_instances()
-                if inst.state == EmulatorState.RUNNING
+                inst.name for inst in self._instance_cache.values()
+                if inst.state is RUNNING
             ]
             if running_instances:
                 self.input_synchronizer.enable_sync(running_instances)
                 self.statusBar().showMessage("Input synchronization enabled")
             else:
-                self.sync_enable_checkbox.setChecked(False)
+                # Block stateChanged so unticking does not re-enter this slot
+                with QSignalBlocker(self.sync_enable_checkbox):
+                    self.sync_enable_checkbox.setChecked(False)
                 QMessageBox.information(self, "No Emulators", "No running emulators to sync.")
         else:
             self.input_synchronizer.disable_sync()
@@ -937,20 +1116,43 @@ class MainWindow(QMainWindow):
     def update_sync_delay(self, value):
         """Update sync delay"""
         self.config.set('input_sync.delay_ms', value)
-        self.config.save_config()
+        self._save_timer.start()
     
     def closeEvent(self, event):
         """Handle window close event"""
+        if self._shutdown_worker is not None:
+            # Emulators are still stopping; the window closes itself when they are done
+            event.ignore()
+            return
+        if self._stop_all_worker is not None:
+            # Same for a Stop All in progress
+            self._close_after_stop_all = True
+            event.ignore()
+            return
+        
+        # Flush a pending debounced config save
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config.save_config()
+        
         self.refresh_thread.stop()
         self.refresh_thread.wait()
+        if self._start_all_worker is not None:
+            # Let pending launches return so the emulators they start are stopped below
+            self._start_all_worker.wait()
+            self._refresh_instance_cache()
+        self.theme_watcher.stop()
+        self.theme_watcher.wait()
+        self.input_synchronizer.shutdown()
         
         # Stop all running emulators
+        RUNNING = EmulatorState.RUNNING
         running_instances = [
-            inst.name for inst in self.emulator_manager.list_instances()
-            if inst.state == EmulatorState.RUNNING
+            inst.name for inst in self._instance_cache.values()
+            if inst.state is RUNNING
         ]
         
-        if running_instances:
+        if running_instances and not self._emulators_stopped:
             # Show shutting down dialog
             progress = QProgressDialog("Shutting down emulators...", None, 0, len(running_instances), self)
             progress.setWindowModality(Qt.WindowModality.WindowModal)
@@ -959,27 +1161,24 @@ class MainWindow(QMainWindow):
             progress.setValue(0)
             progress.setCancelButton(None)  # Disable cancel
             progress.show()
+            self._shutdown_progress = progress
             
-            # Process events to show dialog
-            from PyQt6.QtWidgets import QApplication
-            QApplication.processEvents()
-            
-            for i, name in enumerate(running_instances):
-                progress.setLabelText(f"Stopping {name}...")
-                QApplication.processEvents()
-                
-                self.emulator_manager.stop_emulator(name)
-                self.input_synchronizer.remove_from_sync(name)
-                progress.setValue(i + 1)
+            # Stop them off the UI thread and close again once the worker is done
+            self._shutdown_worker = ShutdownWorker(self.emulator_manager, running_instances)
+            self._shutdown_worker.progress.connect(self._on_shutdown_progress)
+            self._shutdown_worker.finished.connect(self._on_shutdown_finished)
+            self._shutdown_worker.start()
+            event.ignore()
+            return
         
         # Clean up logger handlers to avoid Qt object deletion errors
         if hasattr(self.logger, '_qt_handler') and self.logger._qt_handler:
             try:
                 # Disconnect signal first
                 qt_handler = self.logger._qt_handler
-                if hasattr(qt_handler, 'log_message'):
+                if qt_handler.emitter:
                     try:
-                        qt_handler.log_message.disconnect()
+                        qt_handler.emitter.log_ready.disconnect()
                     except:
                         pass
                 
@@ -995,14 +1194,32 @@ class MainWindow(QMainWindow):
                 pass
         
         event.accept()
+    
+    def _on_shutdown_progress(self, done: int, name: str):
+        """Update the exit progress dialog from the shutdown worker"""
+        self._update_stop_progress(self._shutdown_progress, done, name)
+    
+    def _on_shutdown_finished(self, stopped: List[str]):
+        """Finish closing the window once the shutdown worker is done"""
+        self._shutdown_worker.wait()
+        self._shutdown_worker = None
+        self._emulators_stopped = True
+        
+        for name in stopped:
+            self.input_synchronizer.remove_from_sync(name)
+        
+        if self._shutdown_progress:
+            self._shutdown_progress.close()
+            self._shutdown_progress = None
+        
+        self.close()
 
 
 def main():
     """Main entry point for the GUI application"""
-    from PyQt6.QtWidgets import QApplication
-    
     app = QApplication(sys.argv)
     app.setApplicationName("Android Multi-Emulator Manager")
+    QPixmapCache.setCacheLimit(10240)  # KB; shared with VectorIcon
     
     window = MainWindow()
     window.show()
@@ -1,20 +1,50 @@
 """Settings dialog for configuring Android SDK paths and other settings"""
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QMessageBox, QGroupBox, QFormLayout,
-    QSpinBox, QCheckBox, QTabWidget, QWidget, QComboBox
+    QSpinBox, QCheckBox, QTabWidget, QWidget, QComboBox, QApplication
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ..config_manager import ConfigManager
 from .styles import ThemeStyles
 from .widgets import PremiumSpinBox
 
 
+class WorkerSignals(QObject):
+    """Signals for pool tasks (QRunnable cannot declare signals itself)"""
+    done = pyqtSignal(list)  # Emits the task result
+
+
+class PathCheckTask(QRunnable):
+    """Check that tool paths exist without blocking the UI thread
+
+    Path.exists() can stall for seconds on network (SMB/UNC) SDK installs.
+    """
+    
+    def __init__(self, paths: List[Tuple[str, str]]):
+        super().__init__()
+        self.paths = paths  # (label, path) pairs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Emit the list of error messages for missing paths"""
+        errors = [
+            f"{label} path not found: {path}"
+            for label, path in self.paths
+            if path and not Path(path).exists()
+        ]
+        self.signals.done.emit(errors)
+
+
+# Skip symlink resolution (a stat storm on network mounts) and never offer writes
+BROWSE_OPTIONS = QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.ReadOnly
+
+
 class SettingsDialog(QDialog):
     """Settings dialog for application configuration"""
     
@@ -24,6 +54,8 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
+        self._path_check_task: Optional[PathCheckTask] = None
+        self._file_filters: Dict[str, str] = {}  # filter_name -> QFileDialog filter string
         self.init_ui()
         self.load_settings()
     
@@ -97,9 +129,9 @@ class SettingsDialog(QDialog):
         auto_detect_btn.clicked.connect(self.auto_detect_paths)
         sdk_btn_layout.addWidget(auto_detect_btn)
 
-        test_btn = QPushButton("Test Paths")
-        test_btn.clicked.connect(self.test_paths)
-        sdk_btn_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Test Paths")
+        self.test_btn.clicked.connect(self.test_paths)
+        sdk_btn_layout.addWidget(self.test_btn)
 
         sdk_form.addRow("", sdk_btn_layout)
         
@@ -228,9 +260,12 @@ class SettingsDialog(QDialog):
         current_path = line_edit.text() or str(Path.home())
         
         if is_directory:
-            path = QFileDialog.getExistingDirectory(self, "Select Directory", current_path)
+            path = QFileDialog.getExistingDirectory(
+                self, "Select Directory", current_path,
+                options=BROWSE_OPTIONS | QFileDialog.Option.ShowDirsOnly
+            )
         else:
-            path, _ = QFileDialog.getOpenFileName(self, "Select File", current_path)
+            path, _ = QFileDialog.getOpenFileName(self, "Select File", current_path, options=BROWSE_OPTIONS)
         
         if path:
             line_edit.setText(path)
@@ -238,9 +273,14 @@ class SettingsDialog(QDialog):
     def browse_file(self, line_edit: QLineEdit, filter_name: str = ""):
         """Browse for a file"""
         current_path = line_edit.text() or str(Path.home())
-        filter_str = f"{filter_name} (*{Path(filter_name).suffix});;All Files (*.*)" if filter_name else "All Files (*.*)"
+        filter_str = self._file_filters.get(filter_name)
+        if filter_str is None:
+            filter_str = f"{filter_name} (*{Path(filter_name).suffix});;All Files (*.*)" if filter_name else "All Files (*.*)"
+            self._file_filters[filter_name] = filter_str
         
-        path, _ = QFileDialog.getOpenFileName(self, f"Select {filter_name}", current_path, filter_str)
+        path, _ = QFileDialog.getOpenFileName(
+            self, f"Select {filter_name}", current_path, filter_str, options=BROWSE_OPTIONS
+        )
         
         if path:
             line_edit.setText(path)
@@ -251,10 +291,11 @@ class SettingsDialog(QDialog):
         self.config._detect_android_sdk()
         
         # Update UI with detected paths
-        sdk_root = self.config.config.get('android_sdk', {}).get('root', '')
-        emulator = self.config.config.get('android_sdk', {}).get('emulator', '')
-        adb = self.config.config.get('android_sdk', {}).get('adb', '')
-        avd_manager = self.config.config.get('android_sdk', {}).get('avd_manager', '')
+        sdk = self.config.config.get('android_sdk') or {}
+        sdk_root = sdk.get('root', '')
+        emulator = sdk.get('emulator', '')
+        adb = sdk.get('adb', '')
+        avd_manager = sdk.get('avd_manager', '')
         
         if sdk_root:
             self.sdk_root_edit.setText(sdk_root)
@@ -272,16 +313,22 @@ class SettingsDialog(QDialog):
     
     def test_paths(self):
         """Test if the configured paths are valid"""
-        errors = []
-        
-        if self.emulator_edit.text() and not Path(self.emulator_edit.text()).exists():
-            errors.append(f"Emulator path not found: {self.emulator_edit.text()}")
-        
-        if self.adb_edit.text() and not Path(self.adb_edit.text()).exists():
-            errors.append(f"ADB path not found: {self.adb_edit.text()}")
-        
-        if self.avd_edit.text() and not Path(self.avd_edit.text()).exists():
-            errors.append(f"AVD Manager path not found: {self.avd_edit.text()}")
+        if self._path_check_task is not None:
+            return
+        
+        self._path_check_task = PathCheckTask([
+            ("Emulator", self.emulator_edit.text()),
+            ("ADB", self.adb_edit.text()),
+            ("AVD Manager", self.avd_edit.text()),
+        ])
+        self._path_check_task.signals.done.connect(self._on_paths_tested)
+        self.test_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(self._path_check_task)
+    
+    def _on_paths_tested(self, errors: List[str]):
+        """Report the result of a path check"""
+        self._path_check_task = None
+        self.test_btn.setEnabled(True)
         
         if errors:
             QMessageBox.warning(self, "Path Validation", "Some paths are invalid:\n\n" + "\n".join(errors))
@@ -290,60 +337,69 @@ class SettingsDialog(QDialog):
     
     def load_settings(self):
         """Load current settings into the UI"""
+        cfg = self.config.config
+        sdk = cfg.get('android_sdk') or {}
+        emu = cfg.get('emulator') or {}
+        sync = cfg.get('input_sync') or {}
+        ui = cfg.get('ui') or {}
+        
         # SDK paths
-        sdk_config = self.config.config.get('android_sdk', {})
-        self.sdk_root_edit.setText(sdk_config.get('root', ''))
-        self.emulator_edit.setText(sdk_config.get('emulator', ''))
-        self.adb_edit.setText(sdk_config.get('adb', ''))
-        self.avd_edit.setText(sdk_config.get('avd_manager', ''))
+        self.sdk_root_edit.setText(sdk.get('root', ''))
+        self.emulator_edit.setText(sdk.get('emulator', ''))
+        self.adb_edit.setText(sdk.get('adb', ''))
+        self.avd_edit.setText(sdk.get('avd_manager', ''))
         
         # Emulator settings
-        emulator_config = self.config.config.get('emulator', {})
-        self.hw_accel_checkbox.setChecked(emulator_config.get('hardware_acceleration', True))
-        self.ram_spin.setValue(emulator_config.get('default_ram', 2048))
-        self.vm_heap_spin.setValue(emulator_config.get('default_vm_heap', 256))
+        self.hw_accel_checkbox.setChecked(emu.get('hardware_acceleration', True))
+        self.ram_spin.setValue(emu.get('default_ram', 2048))
+        self.vm_heap_spin.setValue(emu.get('default_vm_heap', 256))
         
         # Input sync settings
-        sync_config = self.config.config.get('input_sync', {})
-        self.sync_delay_spin.setValue(sync_config.get('delay_ms', 0))
-        self.sync_touch_checkbox.setChecked(sync_config.get('sync_touch', True))
-        self.sync_keyboard_checkbox.setChecked(sync_config.get('sync_keyboard', True))
-        self.sync_scroll_checkbox.setChecked(sync_config.get('sync_scroll', True))
+        self.sync_delay_spin.setValue(sync.get('delay_ms', 0))
+        self.sync_touch_checkbox.setChecked(sync.get('sync_touch', True))
+        self.sync_keyboard_checkbox.setChecked(sync.get('sync_keyboard', True))
+        self.sync_scroll_checkbox.setChecked(sync.get('sync_scroll', True))
         
         # UI settings
-        ui_config = self.config.config.get('ui', {})
-        theme = ui_config.get('theme', 'auto')
+        theme = ui.get('theme', 'auto')
         index = self.theme_combo.findData(theme)
         if index >= 0:
             self.theme_combo.setCurrentIndex(index)
     
     def accept(self):
         """Save settings and close dialog"""
+        cfg = self.config.config
+        
         # Save SDK paths
-        self.config.config.setdefault('android_sdk', {})['root'] = self.sdk_root_edit.text()
-        self.config.config.setdefault('android_sdk', {})['emulator'] = self.emulator_edit.text()
-        self.config.config.setdefault('android_sdk', {})['adb'] = self.adb_edit.text()
-        self.config.config.setdefault('android_sdk', {})['avd_manager'] = self.avd_edit.text()
+        cfg.setdefault('android_sdk', {}).update({
+            'root': self.sdk_root_edit.text(),
+            'emulator': self.emulator_edit.text(),
+            'adb': self.adb_edit.text(),
+            'avd_manager': self.avd_edit.text(),
+        })
         
         # Save emulator settings
-        self.config.config.setdefault('emulator', {})['hardware_acceleration'] = self.hw_accel_checkbox.isChecked()
-        self.config.config.setdefault('emulator', {})['default_ram'] = self.ram_spin.value()
-        self.config.config.setdefault('emulator', {})['default_vm_heap'] = self.vm_heap_spin.value()
+        cfg.setdefault('emulator', {}).update({
+            'hardware_acceleration': self.hw_accel_checkbox.isChecked(),
+            'default_ram': self.ram_spin.value(),
+            'default_vm_heap': self.vm_heap_spin.value(),
+        })
         
         # Save input sync settings
-        self.config.config.setdefault('input_sync', {})['delay_ms'] = self.sync_delay_spin.value()
-        self.config.config.setdefault('input_sync', {})['sync_touch'] = self.sync_touch_checkbox.isChecked()
-        self.config.config.setdefault('input_sync', {})['sync_keyboard'] = self.sync_keyboard_checkbox.isChecked()
-        self.config.config.setdefault('input_sync', {})['sync_scroll'] = self.sync_scroll_checkbox.isChecked()
+        cfg.setdefault('input_sync', {}).update({
+            'delay_ms': self.sync_delay_spin.value(),
+            'sync_touch': self.sync_touch_checkbox.isChecked(),
+            'sync_keyboard': self.sync_keyboard_checkbox.isChecked(),
+            'sync_scroll': self.sync_scroll_checkbox.isChecked(),
+        })
         
         # Save UI settings
-        self.config.config.setdefault('ui', {})['theme'] = self.theme_combo.currentData()
+        cfg.setdefault('ui', {})['theme'] = self.theme_combo.currentData()
         
         # Save to file
         self.config.save_config()
         
         # Re-initialize emulator manager with new paths
-        from PyQt6.QtWidgets import QApplication
         app = QApplication.instance()
         if hasattr(app, 'settings_changed'):
             app.settings_changed.emit()
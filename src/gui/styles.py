@@ -1,403 +1,589 @@
+import base64
+import ctypes
 import winreg
-from PyQt6.QtGui import QColor, QPalette, QIcon, QPixmap, QPainter, QPainterPath, QPen, QBrush, QTransform
-from PyQt6.QtCore import Qt, QSize, QRectF
+from ctypes import wintypes
+from string import Template
+from PyQt6.QtGui import QColor, QPalette, QIcon, QPixmap, QPixmapCache, QPainter, QPainterPath, QPen, QBrush, QTransform
+from PyQt6.QtCore import Qt, QSize, QRectF, QThread, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
-class ThemeStyles:
-    # --- SAPPHIRE DARK PALETTE ---
-    DARK_BG = "#12141d"           # Midnight
-    DARK_SURFACE = "#1b1e2b"      # Deep Sapphire
-    DARK_SURFACE_LIGHT = "#242938" # Muted Blue
-    DARK_BORDER = "#2f354a"       # Soft border
-    DARK_ACCENT = "#5d5fef"       # Indigo
-    DARK_ACCENT_SOFT = "#4338ca"  
-    DARK_TEXT = "#f1f5f9"         
-    DARK_TEXT_DIM = "#94a3b8"     
-    DARK_DANGER = "#ef4444"       
-    DARK_SUCCESS = "#22c55e"      
-
-    # --- ARCTIC LIGHT PALETTE ---
-    LIGHT_BG = "#f5f7f9"          # Soft gray-white
-    LIGHT_SURFACE = "#ffffff"     # White
-    LIGHT_SURFACE_LIGHT = "#f1f5f9" # Slate 100
-    LIGHT_BORDER = "#d1d9e6"      # Soft blue-gray border
-    LIGHT_ACCENT = "#3b82f6"      # Modern Blue
-    LIGHT_ACCENT_SOFT = "#2563eb" 
-    LIGHT_TEXT = "#1a202c"        # Deep slate text
-    LIGHT_TEXT_DIM = "#718096"    # Muted Slate
-    LIGHT_DANGER = "#e53e3e"      
-    LIGHT_SUCCESS = "#38a169"     
-
-    @staticmethod
-    def is_dark_mode(preference="auto"):
-        """Detect theme based on preference and Windows registry."""
-        if preference == "dark":
-            return True
-        if preference == "light":
-            return False
-            
-        try:
-            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-            key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            return value == 0
-        except Exception:
-            return True
-
-    @classmethod
-    def apply_theme(cls, app: QApplication, preference="auto"):
-        """Apply theme and force consistent style engine"""
-        is_dark = cls.is_dark_mode(preference)
-        app.setStyle("Fusion")
-        
-        palette = app.palette()
-        if is_dark:
-            palette.setColor(QPalette.ColorRole.Window, QColor(cls.DARK_BG))
-            palette.setColor(QPalette.ColorRole.WindowText, QColor(cls.DARK_TEXT))
-            palette.setColor(QPalette.ColorRole.Base, QColor(cls.DARK_SURFACE))
-            palette.setColor(QPalette.ColorRole.Button, QColor(cls.DARK_SURFACE))
-            palette.setColor(QPalette.ColorRole.ButtonText, QColor(cls.DARK_TEXT))
-            palette.setColor(QPalette.ColorRole.Highlight, QColor(cls.DARK_ACCENT))
-        else:
-            palette.setColor(QPalette.ColorRole.Window, QColor(cls.LIGHT_BG))
-            palette.setColor(QPalette.ColorRole.WindowText, QColor(cls.LIGHT_TEXT))
-            palette.setColor(QPalette.ColorRole.Base, QColor(cls.LIGHT_SURFACE))
-            palette.setColor(QPalette.ColorRole.Button, QColor(cls.LIGHT_SURFACE))
-            palette.setColor(QPalette.ColorRole.ButtonText, QColor(cls.LIGHT_TEXT))
-            palette.setColor(QPalette.ColorRole.Highlight, QColor(cls.LIGHT_ACCENT))
-        
-        app.setPalette(palette)
-        app.setStyleSheet(cls.get_style_sheet(is_dark))
+PERSONALIZE_KEY = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
 
-    @classmethod
-    def get_style_sheet(cls, dark=True):
-        bg = cls.DARK_BG if dark else cls.LIGHT_BG
-        surface = cls.DARK_SURFACE if dark else cls.LIGHT_SURFACE
-        surface_light = cls.DARK_SURFACE_LIGHT if dark else cls.LIGHT_SURFACE_LIGHT
-        text = cls.DARK_TEXT if dark else cls.LIGHT_TEXT
-        text_dim = cls.DARK_TEXT_DIM if dark else cls.LIGHT_TEXT_DIM
-        accent = cls.DARK_ACCENT if dark else cls.LIGHT_ACCENT
-        accent_soft = cls.DARK_ACCENT_SOFT if dark else cls.LIGHT_ACCENT_SOFT
-        border = cls.DARK_BORDER if dark else cls.LIGHT_BORDER
-        danger = cls.DARK_DANGER if dark else cls.LIGHT_DANGER
-        success = cls.DARK_SUCCESS if dark else cls.LIGHT_SUCCESS
-
-        # Pre-calculating hover tints for robust cross-platform rendering
-        def get_rgba_tint(hex_color, alpha=0.12):
-            c = QColor(hex_color)
-            return f"rgba({c.red()}, {c.green()}, {c.blue()}, {alpha})"
-
-        accent_hover_bg = get_rgba_tint(accent)
-        danger_hover_bg = get_rgba_tint(danger)
-
-        # SVG Escaping for data URIs
-        svg_text_dim = text_dim.replace("#", "%23")
-        svg_accent = accent.replace("#", "%23")
-
-        # Base64 encoded SVGs for maximum reliability
-        import base64
-        def get_b64_svg(path_d, color):
-            svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="{path_d}" fill="{color}"/></svg>'
-            return base64.b64encode(svg.encode()).decode()
-
-        svg_up = get_b64_svg("M5 2L1 8h8z", text_dim)
-        svg_up_hover = get_b64_svg("M5 2L1 8h8z", accent)
-        svg_down = get_b64_svg("M5 8L1 2h8z", text_dim)
-        svg_down_hover = get_b64_svg("M5 8L1 2h8z", accent)
-        svg_check = get_b64_svg("M2 5l2 2 4-4", "#ffffff")
-        svg_radio_dot = get_b64_svg("M5 3a2 2 0 100 4 2 2 0 000-4z", "#ffffff")
-
-        return f"""
+# Application stylesheet; placeholders are filled per palette by ThemeStyles.get_style_sheet
+_QSS_TEMPLATE = Template("""
             /* Global Container Defaults */
-            QMainWindow, QDialog, QWidget#centralWidget {{
-                background-color: {bg};
-                color: {text};
+            QMainWindow, QDialog, QWidget#centralWidget {
+                background-color: ${bg};
+                color: ${text};
                 font-family: 'Segoe UI', system-ui, sans-serif;
-            }}
+            }
 
-            QWidget {{
-                color: {text};
+            QWidget {
+                color: ${text};
                 font-family: 'Segoe UI', system-ui, sans-serif;
                 font-size: 13px;
                 outline: none;
-            }}
+            }
 
             /* Headers & Typography */
-            QLabel {{
+            QLabel {
                 background-color: transparent;
-            }}
-            QDialog QLabel {{
+            }
+            QDialog QLabel {
                 padding-top: 5px; /* Vertical alignment for form fields in dialogs */
-            }}
-            QLabel#titleLabel {{
+            }
+            QLabel#titleLabel {
                 font-size: 18px;
                 font-weight: bold;
-                color: {text};
+                color: ${text};
                 padding: 5px 0 15px 0;
-            }}
+            }
 
             /* Tables */
-            QTableWidget {{
-                background-color: {surface};
-                gridline-color: {border};
-                border: 1px solid {border};
+            QTableWidget {
+                background-color: ${surface};
+                gridline-color: ${border};
+                border: 1px solid ${border};
                 border-radius: 10px;
-                selection-background-color: {surface_light};
-                selection-color: {text};
+                selection-background-color: ${surface_light};
+                selection-color: ${text};
                 padding: 2px;
-            }}
-            QHeaderView::section {{
-                background-color: {surface_light};
-                color: {text_dim};
+            }
+            QHeaderView::section {
+                background-color: ${surface_light};
+                color: ${text_dim};
                 padding: 12px;
                 border: none;
-                border-bottom: 2px solid {border};
+                border-bottom: 2px solid ${border};
                 font-weight: bold;
                 text-transform: uppercase;
                 font-size: 10px;
-            }}
-            QHeaderView::section:vertical {{
-                border-bottom: 1px solid {border};
-                border-right: 1px solid {border};
+            }
+            QHeaderView::section:vertical {
+                border-bottom: 1px solid ${border};
+                border-right: 1px solid ${border};
                 padding: 5px 10px;
                 min-width: 40px;
-            }}
-            QTableWidget::item {{
+            }
+            QTableWidget::item {
                 padding: 10px;
-            }}
+            }
 
             /* TABS */
-            QTabWidget {{
+            QTabWidget {
                 border: none;
-            }}
-            QTabWidget::tab-bar {{
+            }
+            QTabWidget::tab-bar {
                 left: 10px;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {border};
-                background: {surface};
+            }
+            QTabWidget::pane {
+                border: 1px solid ${border};
+                background: ${surface};
                 border-radius: 10px;
                 top: -1px;
                 padding: 0px;
-            }}
-            QTabBar::tab {{
+            }
+            QTabBar::tab {
                 background: transparent;
-                color: {text_dim};
+                color: ${text_dim};
                 padding: 12px 24px;
                 margin-right: 4px;
                 border-bottom: 3px solid transparent;
                 font-weight: bold;
                 border-top-left-radius: 8px;
                 border-top-right-radius: 8px;
-            }}
-            QTabBar::tab:selected {{
-                color: {accent};
-                background: {surface};
-                border-bottom: 3px solid {accent};
-            }}
+            }
+            QTabBar::tab:selected {
+                color: ${accent};
+                background: ${surface};
+                border-bottom: 3px solid ${accent};
+            }
 
             /* Buttons */
-            QPushButton {{
-                background-color: {surface};
-                color: {text};
-                border: 1px solid {border};
+            QPushButton {
+                background-color: ${surface};
+                color: ${text};
+                border: 1px solid ${border};
                 border-radius: 8px;
                 padding: 8px 24px;
                 font-weight: 600;
                 min-height: 24px;
-            }}
-            QPushButton:hover {{
-                background-color: {surface_light};
-                border-color: {text_dim};
-            }}
-            QPushButton:disabled {{
-                color: {text_dim};
-                background-color: {surface};
-                border: 1px solid {border};
-            }}
-            QPushButton#primaryButton {{
+            }
+            QPushButton:hover {
+                background-color: ${surface_light};
+                border-color: ${text_dim};
+            }
+            QPushButton:disabled {
+                color: ${text_dim};
+                background-color: ${surface};
+                border: 1px solid ${border};
+            }
+            QPushButton#primaryButton {
                 background-color: transparent;
-                color: {accent};
-                border: 1px solid {accent};
-            }}
-            QPushButton#primaryButton:hover {{
-                background-color: {accent_hover_bg};
-                border-color: {accent_soft};
-            }}
-            QPushButton#primaryButton:disabled {{
-                color: {text_dim};
-                border: 1px solid {border};
-            }}
-            QPushButton#dangerButton {{
+                color: ${accent};
+                border: 1px solid ${accent};
+            }
+            QPushButton#primaryButton:hover {
+                background-color: ${accent_hover_bg};
+                border-color: ${accent_soft};
+            }
+            QPushButton#primaryButton:disabled {
+                color: ${text_dim};
+                border: 1px solid ${border};
+            }
+            QPushButton#dangerButton {
                 background-color: transparent;
-                color: {danger};
-                border: 1px solid {danger};
-            }}
-            QPushButton#dangerButton:hover {{
-                background-color: {danger_hover_bg};
-                border-color: {danger};
-            }}
-            QPushButton#dangerButton:disabled {{
-                color: {text_dim};
-                border: 1px solid {border};
-            }}
+                color: ${danger};
+                border: 1px solid ${danger};
+            }
+            QPushButton#dangerButton:hover {
+                background-color: ${danger_hover_bg};
+                border-color: ${danger};
+            }
+            QPushButton#dangerButton:disabled {
+                color: ${text_dim};
+                border: 1px solid ${border};
+            }
 
             /* Inputs */
-            QLineEdit, QComboBox, QTextEdit {{
-                background-color: {surface_light};
-                border: 2px solid {border};
+            QLineEdit, QComboBox, QTextEdit {
+                background-color: ${surface_light};
+                border: 2px solid ${border};
                 border-radius: 8px;
                 padding: 10px 12px;
-                color: {text};
+                color: ${text};
                 min-height: 20px;
-            }}
-            QLineEdit:focus, QComboBox:focus, QTextEdit:focus {{
-                border-color: {accent};
-            }}
+            }
+            QLineEdit:focus, QComboBox:focus, QTextEdit:focus {
+                border-color: ${accent};
+            }
 
             /* PremiumSpinBox Wrapper Styling */
-            QWidget#spinBoxContainer {{
-                background-color: {surface_light};
-                border: 2px solid {border};
+            PremiumSpinBox {
+                background-color: ${surface_light};
+                border: 2px solid ${border};
                 border-radius: 8px;
                 min-height: 20px;
-            }}
-            QWidget#spinBoxContainer:focus-within {{
-                border-color: {accent};
-            }}
-            QLineEdit#spinBoxEdit {{
+            }
+            PremiumSpinBox:focus-within {
+                border-color: ${accent};
+            }
+            QLineEdit#spinBoxEdit {
                 background: transparent;
                 border: none;
                 padding: 10px;
-                color: {text};
-            }}
-            QWidget#spinBoxButtons {{
-                border-left: 1px solid {border};
-            }}
-            QPushButton#spinBoxUp, QPushButton#spinBoxDown {{
+                color: ${text};
+            }
+            QPushButton#spinBoxUp, QPushButton#spinBoxDown {
                 background-color: transparent;
                 border: none;
                 margin: 0;
                 padding: 0;
-                color: {text_dim};
+                color: ${text_dim};
                 font-size: 7px;
                 border-radius: 0;
                 margin-right: 1px;
-            }}
-            QPushButton#spinBoxUp {{
+            }
+            QPushButton#spinBoxUp {
                 border-top-right-radius: 5px;
-                border-bottom: 1px solid {border};
-                border-left: 1px solid {border};
+                border-bottom: 1px solid ${border};
+                border-left: 1px solid ${border};
                 margin-top: 1px;
-            }}
-            QPushButton#spinBoxDown {{
+            }
+            QPushButton#spinBoxDown {
                 border-bottom-right-radius: 5px;
-                border-left: 1px solid {border};
+                border-left: 1px solid ${border};
                 margin-bottom: 1px;
-            }}
-            QPushButton#spinBoxUp:hover, QPushButton#spinBoxDown:hover {{
-                background-color: {surface};
-                color: {accent};
-            }}
+            }
+            QPushButton#spinBoxUp:hover, QPushButton#spinBoxDown:hover {
+                background-color: ${surface};
+                color: ${accent};
+            }
 
             /* Native SpinBox Fallback (Simplified) */
-            QSpinBox {{
-                background-color: {surface_light};
-                border: 1px solid {border};
+            QSpinBox {
+                background-color: ${surface_light};
+                border: 1px solid ${border};
                 border-radius: 4px;
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
+            }
+            QSpinBox::up-button, QSpinBox::down-button {
                 width: 0;
                 height: 0;
                 border: none;
-            }}
+            }
 
             /* Checkboxes & Radios */
-            QCheckBox, QRadioButton {{
+            QCheckBox, QRadioButton {
                 spacing: 12px;
                 background: transparent;
-            }}
-            QCheckBox::indicator, QRadioButton::indicator {{
+            }
+            QCheckBox::indicator, QRadioButton::indicator {
                 width: 20px;
                 height: 20px;
-                border: 2px solid {border};
-                background-color: {surface_light};
+                border: 2px solid ${border};
+                background-color: ${surface_light};
                 border-radius: 5px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {accent};
-                image: url("data:image/svg+xml;base64,{svg_check}");
-            }}
-            QRadioButton::indicator {{
+            }
+            QCheckBox::indicator:checked {
+                background-color: ${accent};
+                image: url("data:image/svg+xml;base64,${svg_check}");
+            }
+            QRadioButton::indicator {
                 border-radius: 10px;
-                border: 2px solid {border};
-            }}
-            QRadioButton::indicator:checked {{
-                background-color: {accent};
-                border: 2px solid {accent};
-                image: url("data:image/svg+xml;base64,{svg_radio_dot}");
-            }}
-            QRadioButton::indicator:hover {{
-                border-color: {accent};
-            }}
+                border: 2px solid ${border};
+            }
+            QRadioButton::indicator:checked {
+                background-color: ${accent};
+                border: 2px solid ${accent};
+                image: url("data:image/svg+xml;base64,${svg_radio_dot}");
+            }
+            QRadioButton::indicator:hover {
+                border-color: ${accent};
+            }
 
             /* Group Box */
-            QGroupBox {{
-                border: 2px solid {border};
+            QGroupBox {
+                border: 2px solid ${border};
                 border-radius: 12px;
                 margin-top: 30px;
                 padding-top: 6px;
                 font-weight: bold;
-                background-color: {surface};
-            }}
-            QGroupBox::title {{
+                background-color: ${surface};
+            }
+            QGroupBox::title {
                 subcontrol-origin: margin;
                 left: 10px;
                 top: 5px;
                 padding: 0 10px;
-                color: {accent};
-            }}
+                color: ${accent};
+            }
 
             /* Collapsible Sidebar */
-            QPushButton#sidebarHandle {{
-                background-color: {surface};
-                border: 1px solid {border};
+            QPushButton#sidebarHandle {
+                background-color: ${surface};
+                border: 1px solid ${border};
                 border-radius: 6px;
-                color: {accent};
+                color: ${accent};
                 font-weight: bold;
                 font-size: 10px;
                 padding: 10px 0;
-            }}
-            QPushButton#sidebarHandle:hover {{
-                background-color: {accent};
+            }
+            QPushButton#sidebarHandle:hover {
+                background-color: ${accent};
                 color: #ffffff;
-            }}
-            QLabel#sidebarTitle {{
-                color: {accent};
+            }
+            QLabel#sidebarTitle {
+                color: ${accent};
                 font-weight: bold;
                 font-size: 14px;
                 margin-bottom: 10px;
-            }}
-            QWidget#sidebarContent {{
+            }
+            QWidget#sidebarContent {
                 background-color: transparent;
-            }}
+            }
 
             /* Logs Dashboard */
-            QTextEdit#logView {{
-                background-color: {bg};
-                border: 2px solid {border};
+            QTextEdit#logView {
+                background-color: ${bg};
+                border: 2px solid ${border};
                 border-radius: 10px;
                 min-height: 150px;
                 font-family: 'Consolas', monospace;
                 font-size: 11px;
-            }}
+            }
+        """)
+
+
+class ThemeStyles:
+    # --- SAPPHIRE DARK PALETTE ---
+    DARK_BG = "#12141d"           # Midnight
+    DARK_SURFACE = "#1b1e2b"      # Deep Sapphire
+    DARK_SURFACE_LIGHT = "#242938" # Muted Blue
+    DARK_BORDER = "#2f354a"       # Soft border
+    DARK_ACCENT = "#5d5fef"       # Indigo
+    DARK_ACCENT_SOFT = "#4338ca"  
+    DARK_TEXT = "#f1f5f9"         
+    DARK_TEXT_DIM = "#94a3b8"     
+    DARK_DANGER = "#ef4444"       
+    DARK_SUCCESS = "#22c55e"      
+
+    # --- ARCTIC LIGHT PALETTE ---
+    LIGHT_BG = "#f5f7f9"          # Soft gray-white
+    LIGHT_SURFACE = "#ffffff"     # White
+    LIGHT_SURFACE_LIGHT = "#f1f5f9" # Slate 100
+    LIGHT_BORDER = "#d1d9e6"      # Soft blue-gray border
+    LIGHT_ACCENT = "#3b82f6"      # Modern Blue
+    LIGHT_ACCENT_SOFT = "#2563eb" 
+    LIGHT_TEXT = "#1a202c"        # Deep slate text
+    LIGHT_TEXT_DIM = "#718096"    # Muted Slate
+    LIGHT_DANGER = "#e53e3e"      
+    LIGHT_SUCCESS = "#38a169"     
+
+    # Last known Windows app theme; kept current by ThemeWatcher
+    _cached_is_dark = None
+
+    # QPalettes per theme, built lazily by get_palette
+    _dark_palette = None
+    _light_palette = None
+
+    # Generated QSS per palette (is_dark -> sheet); the palette constants never change at runtime
+    _qss_cache = {}
+
+    @classmethod
+    def is_dark_mode(cls, preference="auto"):
+        """Detect theme based on preference and Windows registry."""
+        if preference == "dark":
+            return True
+        if preference == "light":
+            return False
+        
+        if cls._cached_is_dark is None:
+            cls._cached_is_dark = cls.read_system_dark_mode()
+        return cls._cached_is_dark
+
+    @staticmethod
+    def read_system_dark_mode():
+        """Read the Windows app theme from the registry (dark if unknown)"""
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, PERSONALIZE_KEY) as key:
+                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+            return value == 0
+        except Exception:
+            return True
+
+    @classmethod
+    def apply_theme(cls, app: QApplication, preference="auto"):
+        """Apply theme and force consistent style engine
+
+        The stylesheet is only ever set on the QApplication so Qt parses one
+        global sheet; widgets should not call setStyleSheet themselves.
         """
+        is_dark = cls.is_dark_mode(preference)
+        app.setStyle("Fusion")
+        
+        app.setPalette(cls.get_palette(is_dark))
+        
+        # Re-setting an identical sheet still makes Qt re-parse and re-polish everything
+        qss = cls.get_style_sheet(is_dark)
+        qss_hash = hash(qss)
+        if app.property("_qss_hash") != qss_hash:
+            app.setStyleSheet(qss)
+            app.setProperty("_qss_hash", qss_hash)
+
+    @classmethod
+    def get_palette(cls, dark=True):
+        """Return the QPalette for a theme, built on first use"""
+        if dark:
+            if cls._dark_palette is None:
+                cls._dark_palette = cls._build_palette(
+                    cls.DARK_BG, cls.DARK_TEXT, cls.DARK_SURFACE, cls.DARK_ACCENT
+                )
+            return cls._dark_palette
+        if cls._light_palette is None:
+            cls._light_palette = cls._build_palette(
+                cls.LIGHT_BG, cls.LIGHT_TEXT, cls.LIGHT_SURFACE, cls.LIGHT_ACCENT
+            )
+        return cls._light_palette
+
+    @staticmethod
+    def _build_palette(bg, text, surface, accent):
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(bg))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(text))
+        palette.setColor(QPalette.ColorRole.Base, QColor(surface))
+        palette.setColor(QPalette.ColorRole.Button, QColor(surface))
+        palette.setColor(QPalette.ColorRole.ButtonText, QColor(text))
+        palette.setColor(QPalette.ColorRole.Highlight, QColor(accent))
+        return palette
+
+    @classmethod
+    def get_style_sheet(cls, dark=True):
+        dark = bool(dark)
+        cached = cls._qss_cache.get(dark)
+        if cached is not None:
+            return cached
+
+        bg = cls.DARK_BG if dark else cls.LIGHT_BG
+        surface = cls.DARK_SURFACE if dark else cls.LIGHT_SURFACE
+        surface_light = cls.DARK_SURFACE_LIGHT if dark else cls.LIGHT_SURFACE_LIGHT
+        text = cls.DARK_TEXT if dark else cls.LIGHT_TEXT
+        text_dim = cls.DARK_TEXT_DIM if dark else cls.LIGHT_TEXT_DIM
+        accent = cls.DARK_ACCENT if dark else cls.LIGHT_ACCENT
+        accent_soft = cls.DARK_ACCENT_SOFT if dark else cls.LIGHT_ACCENT_SOFT
+        border = cls.DARK_BORDER if dark else cls.LIGHT_BORDER
+        danger = cls.DARK_DANGER if dark else cls.LIGHT_DANGER
+        success = cls.DARK_SUCCESS if dark else cls.LIGHT_SUCCESS
+
+        # Pre-calculating hover tints for robust cross-platform rendering
+        # (palette colours are always #rrggbb, so parse them directly instead of via QColor)
+        def get_rgba_tint(hex_color, alpha=0.12):
+            r = int(hex_color[1:3], 16)
+            g = int(hex_color[3:5], 16)
+            b = int(hex_color[5:7], 16)
+            return f"rgba({r}, {g}, {b}, {alpha})"
+
+        accent_hover_bg = get_rgba_tint(accent)
+        danger_hover_bg = get_rgba_tint(danger)
+
+        # Base64 encoded SVGs for maximum reliability (encoded once at import)
+        svg_check = _SVG_DATA["check"]
+        svg_radio_dot = _SVG_DATA["radio_dot"]
+
+        qss = _QSS_TEMPLATE.substitute(
+            accent=accent,
+            accent_hover_bg=accent_hover_bg,
+            accent_soft=accent_soft,
+            bg=bg,
+            border=border,
+            danger=danger,
+            danger_hover_bg=danger_hover_bg,
+            surface=surface,
+            surface_light=surface_light,
+            svg_check=svg_check,
+            svg_radio_dot=svg_radio_dot,
+            text=text,
+            text_dim=text_dim,
+        )
+        cls._qss_cache[dark] = qss
+        return qss
+
+
+# Fixed SVG shapes used in the stylesheet; only the fill colour varies
+_SVG_SHAPES = {
+    "check": "M2 5l2 2 4-4",
+    "radio": "M5 3a2 2 0 100 4 2 2 0 000-4z",
+}
+
+
+def _svg_b64(path_d, color):
+    """Base64 encode a 10x10 single-path SVG for a QSS data URI"""
+    svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="{path_d}" fill="{color}"/></svg>'
+    return base64.b64encode(svg.encode()).decode()
+
+
+# SVG name -> base64 payload; only what _QSS_TEMPLATE substitutes, the same for both palettes
+_SVG_DATA = {
+    "check": _svg_b64(_SVG_SHAPES["check"], "#ffffff"),
+    "radio_dot": _svg_b64(_SVG_SHAPES["radio"], "#ffffff"),
+}
+
+
+class ThemeWatcher(QThread):
+    """Background thread that reports Windows app theme changes"""
+    theme_changed = pyqtSignal(bool)  # is_dark
+    
+    REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+    WAIT_OBJECT_0 = 0
+    WAIT_TIMEOUT = 0x00000102
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.running = True
+    
+    def run(self):
+        """Wait for registry change notifications on the Personalize key"""
+        advapi32 = ctypes.WinDLL("advapi32")
+        kernel32 = ctypes.WinDLL("kernel32")
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+        advapi32.RegNotifyChangeKeyValue.argtypes = [
+            wintypes.HANDLE, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL
+        ]
+        
+        try:
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, PERSONALIZE_KEY, 0, winreg.KEY_NOTIFY | winreg.KEY_READ)
+        except OSError:
+            return
+        event = kernel32.CreateEventW(None, False, False, None)
+        if not event:
+            key.Close()
+            return
+        
+        try:
+            while self.running:
+                if advapi32.RegNotifyChangeKeyValue(key.handle, False, self.REG_NOTIFY_CHANGE_LAST_SET, event, True) != 0:
+                    break
+                # Wake up periodically so stop() is honoured promptly
+                result = self.WAIT_TIMEOUT
+                while self.running and result == self.WAIT_TIMEOUT:
+                    result = kernel32.WaitForSingleObject(event, 500)
+                # WAIT_FAILED (or anything unexpected) would otherwise spin
+                if not self.running or result != self.WAIT_OBJECT_0:
+                    break
+                
+                is_dark = ThemeStyles.read_system_dark_mode()
+                if is_dark != ThemeStyles._cached_is_dark:
+                    ThemeStyles._cached_is_dark = is_dark
+                    self.theme_changed.emit(is_dark)
+        finally:
+            kernel32.CloseHandle(event)
+            key.Close()
+    
+    def stop(self):
+        """Stop the thread"""
+        self.running = False
+
+
+def _build_gear_teeth():
+    """All eight gear teeth as one path on a unit square"""
+    tooth = QPainterPath()
+    tooth.addRoundedRect(QRectF((1 - 0.14) / 2, 0.05, 0.14, 0.25), 0.05, 0.05)
+    teeth = QPainterPath()
+    for i in range(8):
+        rotation = QTransform()
+        rotation.translate(0.5, 0.5)
+        rotation.rotate(i * 45)
+        rotation.translate(-0.5, -0.5)
+        teeth.addPath(rotation.map(tooth))
+    return teeth
+
+
+_GEAR_TEETH_PATH = _build_gear_teeth()
+_GEAR_TEETH_PATH_SCALED = {}  # size -> teeth path scaled to that icon size
+
+
+_PENCIL_PATH_CACHE = {}  # size -> rotated pencil body path
+
+
+def _pencil_path(s):
+    """Pencil body rotated 45 degrees for an icon of size s"""
+    p = _PENCIL_PATH_CACHE.get(s)
+    if p is None:
+        body_trans = QTransform()
+        body_trans.translate(s*0.5, s*0.5)
+        body_trans.rotate(-45)
+        body_trans.translate(-s*0.5, -s*0.5)
+        
+        body = QPainterPath()
+        body.addRoundedRect(QRectF(s*0.15, s*0.3, s*0.7, s*0.15), s*0.05, s*0.05)
+        p = body_trans.map(body)
+        _PENCIL_PATH_CACHE[s] = p
+    return p
+
 
 class VectorIcon:
     """Refined utility to generate professional QIcons using QPainter paths"""
     
+    # Icons are painted once at this size and QIcon scales them down on request
+    _BASE_SIZE = 32
+    
     @staticmethod
     def get_icon(name: str, color: QColor, size: int = 24) -> QIcon:
+        # Only sizes above the base need their own rendering
+        size = max(size, VectorIcon._BASE_SIZE)
+        
+        # Rendered pixmaps live in Qt's bounded QPixmapCache rather than a Python dict
+        key = f"vecicon:{name}:{color.rgba():08x}"
+        if size != VectorIcon._BASE_SIZE:
+            key += f":{size}"
+        cached = QPixmapCache.find(key)
+        if cached is not None:
+            return QIcon(cached)
+        
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
         
@@ -450,24 +636,20 @@ class VectorIcon:
             hole_r = s * 0.12
             
             # Teeth
-            for i in range(8):
-                angle = i * 45
-                p = QPainterPath()
-                # Tooth shape
-                p.addRoundedRect(QRectF((s - s*0.14)/2, s * 0.05, s*0.14, s*0.25), s*0.05, s*0.05)
-                painter.save()
-                painter.translate(s/2, s/2)
-                painter.rotate(angle)
-                painter.translate(-s/2, -s/2)
-                painter.drawPath(p)
-                painter.restore()
+            teeth = _GEAR_TEETH_PATH_SCALED.get(size)
+            if teeth is None:
+                teeth = QTransform.fromScale(s, s).map(_GEAR_TEETH_PATH)
+                _GEAR_TEETH_PATH_SCALED[size] = teeth
+            painter.drawPath(teeth)
             
             # Core circle
-            path.addEllipse(QRectF((s - outer_r*2)/2, (s - outer_r*2)/2, outer_r*2, outer_r*2))
-            # Subtract inner hole
-            hole = QPainterPath()
-            hole.addEllipse(QRectF((s - hole_r*2)/2, (s - hole_r*2)/2, hole_r*2, hole_r*2))
-            path = path.subtracted(hole)
+            painter.drawEllipse(QRectF((s - outer_r*2)/2, (s - outer_r*2)/2, outer_r*2, outer_r*2))
+            # Punch out the inner hole (cheaper than a path boolean subtract);
+            # DestinationOut scales by source alpha so the antialiased rim stays smooth
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationOut)
+            painter.setBrush(QBrush(Qt.GlobalColor.black))
+            painter.drawEllipse(QRectF((s - hole_r*2)/2, (s - hole_r*2)/2, hole_r*2, hole_r*2))
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
             
         elif name == "trash":
             # Clean Bin Icon
@@ -540,15 +722,9 @@ class VectorIcon:
             path.addPath(tip)
             
             # Pencil body (rectangle rotated)
-            body_trans = QTransform()
-            body_trans.translate(s*0.5, s*0.5)
-            body_trans.rotate(-45)
-            body_trans.translate(-s*0.5, -s*0.5)
-            
-            body = QPainterPath()
-            body.addRoundedRect(QRectF(s*0.15, s*0.3, s*0.7, s*0.15), s*0.05, s*0.05)
-            path.addPath(body_trans.map(body))
+            path.addPath(_pencil_path(s))
         
         painter.drawPath(path)
         painter.end()
+        QPixmapCache.insert(key, pixmap)
         return QIcon(pixmap)
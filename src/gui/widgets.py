@@ -1,7 +1,7 @@
 """Custom UI widgets for a premium experience"""
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QLabel, QSizePolicy
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QGridLayout, QLineEdit, QPushButton, QLabel, QSizePolicy
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from PyQt6.QtGui import QIntValidator
 
 class PremiumSpinBox(QWidget):
@@ -11,42 +11,41 @@ class PremiumSpinBox(QWidget):
     """
     valueChanged = pyqtSignal(int)
     
+    # Validators shared between spin boxes with the same range, keyed by (min, max)
+    _validator_cache = {}
+    
     def __init__(self, parent=None, min_val=0, max_val=99999, initial_val=0):
         super().__init__(parent)
         self.min_val = min_val
         self.max_val = max_val
-        self.value = initial_val
+        self._value = initial_val
+        
+        # Typed input settles for a moment before valueChanged fires
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(80)
+        self._emit_timer.timeout.connect(lambda: self.valueChanged.emit(self._value))
         
         self.init_ui()
         
     def init_ui(self):
-        # Main horizontal layout
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
+        # The spin box itself draws the LineEdit-like frame
+        self.setObjectName("spinBoxContainer")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
-        # Container to mimic the LineEdit look
-        self.container = QWidget()
-        self.container.setObjectName("spinBoxContainer")
-        self.container_layout = QHBoxLayout(self.container)
-        self.container_layout.setContentsMargins(1, 1, 1, 1) # Space for border
-        self.container_layout.setSpacing(0)
+        # Single grid: the input spans both rows, the buttons stack on the right
+        self.main_layout = QGridLayout(self)
+        self.main_layout.setContentsMargins(1, 1, 1, 1) # Space for border
+        self.main_layout.setSpacing(0)
         
         # Input field
-        self.line_edit = QLineEdit(str(self.value))
+        self.line_edit = QLineEdit(str(self._value))
         self.line_edit.setObjectName("spinBoxEdit")
         self.line_edit.setFrame(False)
         self.line_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.line_edit.setValidator(QIntValidator(self.min_val, self.max_val))
+        self.line_edit.setValidator(self._shared_validator())
         self.line_edit.textChanged.connect(self._on_text_changed)
-        self.container_layout.addWidget(self.line_edit)
-        
-        # Button container
-        btn_container = QWidget()
-        btn_container.setObjectName("spinBoxButtons")
-        btn_layout = QVBoxLayout(btn_container)
-        btn_layout.setContentsMargins(0, 0, 0, 0)
-        btn_layout.setSpacing(0)
+        self.main_layout.addWidget(self.line_edit, 0, 0, 2, 1)
         
         self.up_btn = QPushButton("▲")
         self.up_btn.setObjectName("spinBoxUp")
@@ -58,11 +57,8 @@ class PremiumSpinBox(QWidget):
         self.down_btn.setFixedWidth(24)
         self.down_btn.clicked.connect(self.decrement)
         
-        btn_layout.addWidget(self.up_btn)
-        btn_layout.addWidget(self.down_btn)
-        
-        self.container_layout.addWidget(btn_container)
-        self.main_layout.addWidget(self.container)
+        self.main_layout.addWidget(self.up_btn, 0, 1)
+        self.main_layout.addWidget(self.down_btn, 1, 1)
         
     def _on_text_changed(self, text):
         if not text:
@@ -70,30 +66,42 @@ class PremiumSpinBox(QWidget):
         try:
             val = int(text)
             if self.min_val <= val <= self.max_val:
-                self.value = val
-                self.valueChanged.emit(self.value)
+                self._value = val
+                self._emit_timer.start()
         except ValueError:
             pass
 
+    def _shared_validator(self):
+        """Return the shared validator for the current range"""
+        key = (self.min_val, self.max_val)
+        validator = PremiumSpinBox._validator_cache.get(key)
+        if validator is None:
+            # Unparented and held by the cache, so it outlives any one line edit
+            validator = QIntValidator(*key)
+            PremiumSpinBox._validator_cache[key] = validator
+        return validator
+
     def setValue(self, value):
         val = max(self.min_val, min(self.max_val, value))
-        self.value = val
+        self._value = val
         self.line_edit.setText(str(val))
-        self.valueChanged.emit(self.value)
+        # Emit right away; drop the debounced emit queued by the text change
+        self._emit_timer.stop()
+        self.valueChanged.emit(self._value)
         
     def getValue(self):
-        return self.value
+        return self._value
         
     def value(self):
         """QSpinBox compatibility"""
-        return self.value
+        return self._value
         
     def setRange(self, min_val, max_val):
         """QSpinBox compatibility"""
         self.min_val = min_val
         self.max_val = max_val
-        self.line_edit.setValidator(QIntValidator(self.min_val, self.max_val))
-        self.setValue(self.value)
+        self.line_edit.setValidator(self._shared_validator())
+        self.setValue(self._value)
 
     def setSingleStep(self, step):
         """QSpinBox compatibility (stub)"""
@@ -106,11 +114,11 @@ class PremiumSpinBox(QWidget):
         
     def increment(self):
         step = getattr(self, 'step', 1)
-        self.setValue(self.value + step)
+        self.setValue(self._value + step)
         
     def decrement(self):
         step = getattr(self, 'step', 1)
-        self.setValue(self.value - step)
+        self.setValue(self._value - step)
 
 class CollapsiblePanel(QWidget):
     """
@@ -147,27 +155,46 @@ class CollapsiblePanel(QWidget):
         
         self.main_layout.addWidget(self.header)
         
-        # Content area
+        # Content area is built on first expand; widgets added before then wait here
+        self.content = None
+        self.content_layout = None
+        self._pending_widgets = []
+        if not self.is_collapsed:
+            self._ensure_content()
+
+    def _ensure_content(self):
+        """Create the content area and move pending widgets into it"""
+        if self.content is not None:
+            return
         self.content = QWidget()
         self.content_layout = QVBoxLayout(self.content)
         self.content_layout.setContentsMargins(0, 10, 0, 0)
+        for widget in self._pending_widgets:
+            self.content_layout.addWidget(widget)
+        self._pending_widgets.clear()
         self.main_layout.addWidget(self.content)
-        
-        if self.is_collapsed:
-            self.content.hide()
+        self.content.setVisible(not self.is_collapsed)
 
     def _get_toggle_icon(self):
         return "▶️" if self.is_collapsed else "▼"
 
     def toggle(self):
         self.is_collapsed = not self.is_collapsed
-        self.content.setVisible(not self.is_collapsed)
+        if self.content is None:
+            if not self.is_collapsed:
+                self._ensure_content()
+        else:
+            self.content.setVisible(not self.is_collapsed)
         self.toggle_btn.setText(self._get_toggle_icon())
         
     def addWidget(self, widget):
-        self.content_layout.addWidget(widget)
+        if self.content is None:
+            self._pending_widgets.append(widget)
+        else:
+            self.content_layout.addWidget(widget)
         
     def setLayout(self, layout):
+        self._ensure_content()
         self.content.setLayout(layout)
 
 class CollapsibleSidebar(QWidget):
@@ -176,6 +203,10 @@ class CollapsibleSidebar(QWidget):
     """
     toggled = pyqtSignal(bool)
     
+    # Handle labels: arrow, the word "AVDs" stacked vertically, arrow
+    _HANDLE_COLLAPSED = "◀\n\nA\nV\nD\ns\n\n◀"
+    _HANDLE_EXPANDED = "▶\n\nA\nV\nD\ns\n\n▶"
+    
     def __init__(self, title="", parent=None, collapsed=True, min_content_width=300):
         super().__init__(parent)
         self.is_collapsed = collapsed
@@ -195,7 +226,7 @@ class CollapsibleSidebar(QWidget):
             QSizePolicy.Policy.Expanding
         )
         self.handle.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.handle.setText("◀\n\nA\nV\nD\ns\n\n◀" if self.is_collapsed else "▶\n\nA\nV\nD\ns\n\n▶")
+        self.handle.setText(self._HANDLE_COLLAPSED if self.is_collapsed else self._HANDLE_EXPANDED)
         self.handle.clicked.connect(self.toggle)
         self.main_layout.addWidget(self.handle)
         
@@ -223,7 +254,7 @@ class CollapsibleSidebar(QWidget):
     def toggle(self):
         self.is_collapsed = not self.is_collapsed
         self.content_container.setVisible(not self.is_collapsed)
-        self.handle.setText("◀\n\nA\nV\nD\ns\n\n◀" if self.is_collapsed else "▶\n\nA\nV\nD\ns\n\n▶")
+        self.handle.setText(self._HANDLE_COLLAPSED if self.is_collapsed else self._HANDLE_EXPANDED)
         
         if self.is_collapsed:
             self.setMaximumWidth(24)
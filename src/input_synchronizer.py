@@ -3,14 +3,17 @@
 import time
 import subprocess
 import threading
-import queue
+import socket
 import ctypes
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes
 from typing import List, Optional, Set, Dict, Tuple
 from dataclasses import dataclass
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor
 
 # Import pynput (wrap in try-except to handle connection errors gently)
 try:
@@ -20,25 +23,350 @@ except ImportError:
     mouse = None
     keyboard = None
 
+# psutil is only needed to match windows owned by an emulator's child process
+try:
+    import psutil
+    _HAVE_PSUTIL = True
+except ImportError:
+    psutil = None
+    _HAVE_PSUTIL = False
+
 from .config_manager import ConfigManager
 from .emulator_manager import EmulatorManager, EmulatorInstance
 
 # Ctypes definitions for Windows
 user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_OBJECT_DESTROY = 0x8001
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProcType,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
 
-def get_window_rect(hwnd):
-    rect = wintypes.RECT()
+# Per-thread out-parameter buffers, reused across calls
+_tls = threading.local()
+
+def get_window_rect(hwnd) -> Tuple[int, int, int, int]:
+    """Return (left, top, right, bottom) of a window"""
+    rect = getattr(_tls, 'rect', None)
+    if rect is None:
+        rect = _tls.rect = wintypes.RECT()
     user32.GetWindowRect(hwnd, ctypes.byref(rect))
-    return rect
+    return rect.left, rect.top, rect.right, rect.bottom
+
+# hwnd -> owning pid; only trustworthy while an EVENT_OBJECT_DESTROY hook evicts dead windows
+_hwnd_pid_cache: Dict[int, int] = {}
 
-def get_window_pid(hwnd):
-    pid = wintypes.DWORD()
-    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-    return pid.value
+def get_window_pid(hwnd, cached: bool = False):
+    if cached:
+        pid = _hwnd_pid_cache.get(hwnd)
+        if pid is not None:
+            return pid
+    buf = getattr(_tls, 'pid', None)
+    if buf is None:
+        buf = _tls.pid = wintypes.DWORD()
+    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(buf))
+    pid = buf.value
+    if cached and pid:
+        _hwnd_pid_cache[hwnd] = pid
+    return pid
 
 def get_foreground_window():
     return user32.GetForegroundWindow()
 
+class WinEventHookThread(threading.Thread):
+    """Runs WinEvent hooks on a thread with its own message loop
+    
+    Out-of-context hooks are delivered through the message queue of the
+    thread that installed them, so that thread must pump messages.
+    """
+    
+    def __init__(self, events: List[int], callback):
+        super().__init__(daemon=True)
+        self.events = events
+        self.callback = callback  # callback(event, hwnd, id_object, id_child)
+        self._thread_id = None
+        self._ready = threading.Event()
+        self.hooked = False  # True once every hook is installed
+        # Keep a reference so the C callback is not garbage collected
+        self._proc = WinEventProcType(self._handle_event)
+    
+    def _handle_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        try:
+            self.callback(event, hwnd, id_object, id_child)
+        except Exception:
+            pass
+    
+    def run(self):
+        self._thread_id = kernel32.GetCurrentThreadId()
+        hooks = [
+            user32.SetWinEventHook(event, event, None, self._proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+            for event in self.events
+        ]
+        self.hooked = all(hooks)
+        self._ready.set()
+        
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+        
+        self.hooked = False
+        for hook in hooks:
+            if hook:
+                user32.UnhookWinEvent(hook)
+    
+    def stop(self):
+        """Stop the message loop and remove the hooks"""
+        self._ready.wait(timeout=1)
+        if self._thread_id:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+
+class ActionQueue:
+    """Bounded queue of sync actions for the worker thread
+    
+    When full, the oldest key event is discarded first so taps and swipes
+    survive a burst of typing. Mouse presses are only dropped together with
+    their release, so the worker never sees half a tap.
+    """
+    
+    def __init__(self, maxlen: int = 256):
+        self.maxlen = maxlen
+        self._items = deque()
+        self._cond = threading.Condition()
+    
+    def put(self, action):
+        """Queue an action, shedding old ones as described above if full"""
+        with self._cond:
+            if len(self._items) >= self.maxlen:
+                self._drop_one()
+            self._items.append(action)
+            self._cond.notify()
+    
+    def get(self):
+        """Block until an action is available and return it"""
+        with self._cond:
+            while not self._items:
+                self._cond.wait()
+            return self._items.popleft()
+    
+    def clear(self):
+        """Discard every queued action"""
+        with self._cond:
+            self._items.clear()
+    
+    def _drop_one(self):
+        """Discard the oldest key event, else the oldest press and its release (lock held)"""
+        items = self._items
+        press_index = None
+        for i, action in enumerate(items):
+            kind = action[0] if isinstance(action, tuple) else None
+            if kind == 'key':
+                del items[i]
+                return
+            if kind == 'raw_press' and press_index is None:
+                press_index = i
+        
+        if press_index is None:
+            items.popleft()
+            return
+        
+        button = items[press_index][1][2]
+        for i in range(press_index + 1, len(items)):
+            action = items[i]
+            if isinstance(action, tuple) and action[0] == 'raw_release' and action[1][2] == button:
+                del items[i]
+                break
+        # A press whose release is not queued yet is still dropped; the
+        # release then finds no matching press and is ignored
+        del items[press_index]
+
+class MinitouchConnection:
+    """Socket to a minitouch server already running on a device
+    
+    Touches written here skip adb shell and the input command entirely.
+    Coordinates are in minitouch's own range, given by the banner.
+    """
+    
+    PRESSURE = 50
+    
+    def __init__(self, sock: socket.socket, port: int, max_x: int, max_y: int, max_pressure: int):
+        self.sock = sock
+        self.port = port
+        self.max_x = max_x
+        self.max_y = max_y
+        self.pressure = min(self.PRESSURE, max_pressure)
+    
+    @classmethod
+    def open(cls, adb_path: str, device_id: str) -> Optional["MinitouchConnection"]:
+        """Forward a local port to the device's minitouch socket and connect
+        
+        Returns None when minitouch is not running on the device.
+        """
+        try:
+            result = subprocess.run(
+                [adb_path, "-s", device_id, "forward", "tcp:0", "localabstract:minitouch"],
+                capture_output=True, text=True, timeout=2,
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            )
+            port = int(result.stdout.strip())
+        except (subprocess.SubprocessError, OSError, ValueError):
+            return None
+        
+        sock = None
+        try:
+            sock = socket.create_connection(("127.0.0.1", port), timeout=0.5)
+            limits = cls._read_banner(sock)
+            if limits:
+                sock.settimeout(None)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                return cls(sock, port, *limits)
+        except OSError:
+            pass
+        
+        # adb accepts the forward even with nothing listening on the device
+        if sock:
+            sock.close()
+        cls._remove_forward(adb_path, device_id, port)
+        return None
+    
+    @staticmethod
+    def _read_banner(sock: socket.socket) -> Optional[Tuple[int, int, int]]:
+        """Read the banner and return (max x, max y, max pressure)
+        
+        Banner lines: "v <version>", "^ <contacts> <max-x> <max-y> <max-pressure>", "$ <pid>"
+        """
+        data = b""
+        while b"\n$" not in data or not data.endswith(b"\n"):
+            chunk = sock.recv(256)
+            if not chunk:
+                return None
+            data += chunk
+        for line in data.decode(errors="replace").splitlines():
+            parts = line.split()
+            if len(parts) == 5 and parts[0] == "^":
+                return int(parts[2]), int(parts[3]), int(parts[4])
+        return None
+    
+    @staticmethod
+    def _remove_forward(adb_path: str, device_id: str, port: int):
+        try:
+            subprocess.run(
+                [adb_path, "-s", device_id, "forward", "--remove", f"tcp:{port}"],
+                capture_output=True, timeout=2,
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            )
+        except (subprocess.SubprocessError, OSError):
+            pass
+    
+    def scale(self, x: int, y: int, res: "DeviceResolution") -> Tuple[int, int]:
+        """Map device pixels to minitouch coordinates"""
+        return x * self.max_x // res.width, y * self.max_y // res.height
+    
+    def send(self, commands: bytes):
+        """Write raw minitouch commands; raises OSError if the socket is gone"""
+        self.sock.sendall(commands)
+    
+    def close(self, adb_path: str, device_id: str):
+        """Close the socket and drop the port forward"""
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+        self._remove_forward(adb_path, device_id, self.port)
+
+class SendScheduler(threading.Thread):
+    """Runs device writes at their deadlines on a single thread
+    
+    Keeps the sync delay off the queue worker, so a stagger between devices
+    never holds up the next input, and serializes the writes so two sends
+    never interleave on one pipe or socket.
+    """
+    
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._heap = []  # (monotonic deadline, sequence, fn, args)
+        self._seq = itertools.count()  # keeps equal deadlines in submission order
+        self._cond = threading.Condition()
+        self._stopped = False
+    
+    def schedule(self, deadline: float, fn, *args):
+        """Call fn(*args) once time.monotonic() reaches deadline"""
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), fn, args))
+            self._cond.notify()
+    
+    def clear(self):
+        """Drop every pending write"""
+        with self._cond:
+            self._heap.clear()
+    
+    def stop(self):
+        """Drop pending writes and end the thread"""
+        with self._cond:
+            self._stopped = True
+            self._heap.clear()
+            self._cond.notify()
+    
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._heap:
+                        wait = self._heap[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, fn, args = heapq.heappop(self._heap)
+            try:
+                fn(*args)
+            except Exception:
+                pass
+
+# "wm size" output, e.g. "Physical size: 1080x2400"
+_SIZE_RE = re.compile(r"size:\s*(\d+)x(\d+)")
+
+_KEYCODE_MAP = {
+    # Numbers
+    '0': 7, '1': 8, '2': 9, '3': 10, '4': 11,
+    '5': 12, '6': 13, '7': 14, '8': 15, '9': 16,
+    # Letters
+    'a': 29, 'b': 30, 'c': 31, 'd': 32, 'e': 33,
+    'f': 34, 'g': 35, 'h': 36, 'i': 37, 'j': 38,
+    'k': 39, 'l': 40, 'm': 41, 'n': 42, 'o': 43,
+    'p': 44, 'q': 45, 'r': 46, 's': 47, 't': 48,
+    'u': 49, 'v': 50, 'w': 51, 'x': 52, 'y': 53, 'z': 54,
+    # Special keys
+    'ENTER': 66, 'BACKSPACE': 67, 'SPACE': 62,
+    'HOME': 3, 'BACK': 4, 'MENU': 82,
+    'ESC': 111,
+    'UP': 19, 'DOWN': 20, 'LEFT': 21, 'RIGHT': 22,
+}
+# Key chars and names arrive in either case; map both so lookups need no normalising
+_KEYCODE_MAP.update({name.swapcase(): code for name, code in list(_KEYCODE_MAP.items())})
+
 @dataclass
 class DeviceResolution:
     width: int
@@ -47,6 +375,16 @@ class DeviceResolution:
 class InputSynchronizer:
     """Synchronizes input across multiple emulator instances using global hooks"""
     
+    # Emulator window chrome around the device screen, in pixels
+    TITLE_BAR_HEIGHT = 30
+    BORDER_WIDTH = 8
+    
+    # Seconds an inverted process table stays valid; covers a press/release pair
+    CHILD_MAP_TTL = 0.2
+    
+    # Interval between interpolated minitouch swipe frames
+    MINITOUCH_FRAME_MS = 16
+    
     def __init__(self, config: ConfigManager, emulator_manager: EmulatorManager):
         self.config = config
         self.emulator_manager = emulator_manager
@@ -54,43 +392,80 @@ class InputSynchronizer:
         self.synced_instances: Set[str] = set()
         
         # Threading for assignments
-        self.action_queue = queue.Queue()
+        self.action_queue = ActionQueue()
+        self._stop_sentinel = object()  # queued to wake the worker; it exits if _shutting_down is set
+        self._shutting_down = False
         self.worker_thread = threading.Thread(target=self._process_queue, daemon=True)
         self.worker_thread.start()
+        # Performs the actual device writes, staggered by the sync delay
+        self._scheduler = SendScheduler()
+        self._scheduler.start()
         
         # Listeners
         self.mouse_listener = None
         self.key_listener = None
         
-        # Concurrency
-        self.executor = None
+        # One long-lived "adb shell" per device; commands are written to its stdin
+        self._adb_shells: Dict[str, subprocess.Popen] = {}
+        self._adb_shells_lock = threading.Lock()
+        
+        # minitouch sockets by device id; None once a device is known not to run minitouch
+        self._minitouch: Dict[str, Optional[MinitouchConnection]] = {}
+        self._minitouch_lock = threading.Lock()
+        self._minitouch_generation = 0 # bumped on close so in-flight probes discard their socket
+        self._touch_busy_until: Dict[str, float] = {} # device id -> end of its scheduled minitouch gesture
+        
+        # Runs the per-instance adb/psutil warm-up off the calling (GUI) thread
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sync-prefetch")
         
         # Cache
         self.resolutions: Dict[str, DeviceResolution] = {}
         self.window_info: Dict[str, int] = {} # instance_name -> hwnd (lazy update)
         self.last_press_info: Dict[mouse.Button, dict] = {} # Track button state for swipe
+        self._child_map: Optional[Dict[int, List[int]]] = None # ppid -> child pids
+        self._child_map_time = 0.0
+        self._psutil_proc: Dict[str, "psutil.Process"] = {} # instance name -> emulator process
+        self._pid_to_instance: Dict[int, str] = {} # emulator pid -> instance name
+        self._pid_map_version = -1 # instances_version _pid_to_instance was built from
+        
+        # Foreground window cache, kept current by WinEvent hooks while listening
+        self._win_event_thread: Optional[WinEventHookThread] = None
+        self._fg_cache: Optional[Tuple[int, int, Optional[str]]] = None # (hwnd, instances_version, name)
+        self._geom_cache: Dict[int, Tuple[int, int, int, int]] = {} # hwnd -> (origin x, origin y, width, height)
 
     def enable_sync(self, instance_names: List[str]) -> None:
         """Enable synchronization for specified instances"""
         self.synced_instances = set(instance_names)
         if not self.sync_enabled and self.synced_instances:
-            if not self.executor:
-                self.executor = ThreadPoolExecutor(max_workers=10)
             self._start_listening()
         self.sync_enabled = True
         
-        # Prefetch resolutions
+        # Prefetch resolutions etc. in the background; each needs its own adb round trip
         for name in instance_names:
-            self._get_device_resolution(name)
+            self._prefetch_executor.submit(self._prefetch_instance, name)
 
     def disable_sync(self) -> None:
         """Disable synchronization"""
         self.sync_enabled = False
         self.synced_instances.clear()
         self._stop_listening()
-        if self.executor:
-            self.executor.shutdown(wait=False)
-            self.executor = None
+        # Drop anything still queued for instances that are no longer synced
+        self.action_queue.clear()
+        self.action_queue.put(self._stop_sentinel)
+        self._scheduler.clear()
+        self._touch_busy_until.clear()
+        self._close_adb_shells()
+        self._close_minitouch()
+
+    def shutdown(self) -> None:
+        """Disable sync and stop the worker thread"""
+        if self._shutting_down:
+            return
+        self._shutting_down = True
+        self.disable_sync()
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._scheduler.stop()
+        self.worker_thread.join(timeout=1)
 
     def add_to_sync(self, instance_name: str) -> None:
         """Add an instance to synchronization group"""
@@ -98,7 +473,7 @@ class InputSynchronizer:
         if not self.sync_enabled:
             self.enable_sync(list(self.synced_instances))
         else:
-            self._get_device_resolution(instance_name)
+            self._prefetch_executor.submit(self._prefetch_instance, instance_name)
 
     def remove_from_sync(self, instance_name: str) -> None:
         """Remove an instance from synchronization group"""
@@ -106,6 +481,12 @@ class InputSynchronizer:
         if not self.synced_instances:
             self.disable_sync()
 
+    def _prefetch_instance(self, instance_name: str):
+        """Warm the per-instance caches used on the input path"""
+        self._get_device_resolution(instance_name)
+        self._prime_psutil_proc(instance_name)
+        self._open_minitouch(instance_name)
+
     def _start_listening(self):
         """Start global input listeners"""
         if not mouse or not keyboard:
@@ -119,10 +500,27 @@ class InputSynchronizer:
             # We only listen for basic keys to avoid interfering with system
             self.key_listener = keyboard.Listener(on_release=self._on_key_release)
             self.key_listener.start()
+        
+        if not self._win_event_thread:
+            self._fg_cache = None
+            self._geom_cache.clear()
+            _hwnd_pid_cache.clear()
+            self._win_event_thread = WinEventHookThread(
+                [EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_MOVESIZEEND, EVENT_OBJECT_DESTROY],
+                self._on_win_event
+            )
+            self._win_event_thread.start()
             
             
     def _stop_listening(self):
         """Stop global input listeners"""
+        if self._win_event_thread:
+            self._win_event_thread.stop()
+            self._win_event_thread.join(timeout=1)
+            self._win_event_thread = None
+            self._fg_cache = None
+            self._geom_cache.clear()
+            _hwnd_pid_cache.clear()
         if self.mouse_listener:
             try:
                 self.mouse_listener.stop()
@@ -134,146 +532,270 @@ class InputSynchronizer:
             except: pass
             self.key_listener = None
 
-    def _get_active_instance_name(self) -> Optional[str]:
-        """Get the name of the instance corresponding to the foreground window"""
+    def _on_win_event(self, event: int, hwnd: int, id_object: int, id_child: int):
+        """Update the window caches from WinEvent hook notifications"""
+        if event == EVENT_OBJECT_DESTROY:
+            # Also fired for carets, menus etc.; only whole windows matter
+            if id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+                _hwnd_pid_cache.pop(hwnd, None)
+                self._geom_cache.pop(hwnd, None)
+        elif event == EVENT_SYSTEM_FOREGROUND:
+            self._geom_cache.pop(hwnd, None)
+            version = self.emulator_manager.instances_version
+            self._fg_cache = (hwnd, version, self._resolve_instance_name(hwnd))
+        elif event == EVENT_SYSTEM_MOVESIZEEND:
+            self._geom_cache.pop(hwnd, None)
+
+    def _get_window_instance(self, hwnd: int) -> Optional[str]:
+        """Get the instance a window belongs to, using the foreground cache when it matches"""
+        version = self.emulator_manager.instances_version
+        hooked = self._hooks_active()
+        cached = self._fg_cache
+        if hooked and cached is not None and cached[0] == hwnd and cached[1] == version:
+            return cached[2]
+        
+        name = self._resolve_instance_name(hwnd)
+        # Don't overwrite a newer value stored by the hook in the meantime
+        if hooked and cached is not None and cached[0] == hwnd and self._fg_cache is cached:
+            self._fg_cache = (hwnd, version, name)
+        return name
+
+    def _hooks_active(self) -> bool:
+        """Whether the WinEvent hooks are installed and keeping the caches current"""
+        thread = self._win_event_thread
+        return thread is not None and thread.hooked
+
+    def _get_window_geometry(self, hwnd: int) -> Tuple[int, int, int, int]:
+        """Get the screen area of an emulator window as (origin x, origin y, width, height)
+        
+        Reused until the window moves or resizes.
+        """
+        hooked = self._hooks_active()
+        geom = self._geom_cache.get(hwnd) if hooked else None
+        if geom is None:
+            left, top, right, bottom = get_window_rect(hwnd)
+            border = self.BORDER_WIDTH
+            title = self.TITLE_BAR_HEIGHT
+            geom = (
+                left + border,
+                top + title,
+                right - left - (border * 2),
+                bottom - top - title - border,
+            )
+            if hooked:
+                self._geom_cache[hwnd] = geom
+        return geom
+
+    def _resolve_instance_name(self, hwnd: int) -> Optional[str]:
+        """Get the name of the instance that owns a window"""
         try:
-            hwnd = get_foreground_window()
-            pid = get_window_pid(hwnd)
+            pid = get_window_pid(hwnd, cached=self._hooks_active())
             
             # Check our running instances
-            for instance in self.emulator_manager.instances.values():
-                if instance.pid == pid:
-                    return instance.name
+            name = self._get_pid_map().get(pid)
+            if name:
+                return name
+            instances = list(self.emulator_manager.instances.values())
+            
+            # Also check for child processes (qemu often runs as child of emulator)
+            if not _HAVE_PSUTIL:
+                return None
+            child_map = self._get_child_map()
+            for instance in instances:
+                if not instance.pid:
+                    continue
+                if child_map is None:
+                    try:
+                        children = self._get_psutil_proc(instance).children(recursive=True)
+                    except psutil.Error:
+                        self._psutil_proc.pop(instance.name, None)
+                        continue
+                    if any(child.pid == pid for child in children):
+                        return instance.name
+                    continue
                 
-                # Also check for child processes (qemu often runs as child of emulator)
-                try:
-                    import psutil
-                    parent = psutil.Process(instance.pid)
-                    children = parent.children(recursive=True)
-                    for child in children:
-                        if child.pid == pid:
-                            return instance.name
-                except:
-                    pass
+                # Walk the descendants of the emulator process in memory
+                stack = list(child_map.get(instance.pid, ()))
+                seen = set()
+                while stack:
+                    p = stack.pop()
+                    if p == pid:
+                        return instance.name
+                    if p not in seen:
+                        seen.add(p)
+                        stack.extend(child_map.get(p, ()))
         except Exception as e:
             print(f"DEBUG: Window check error: {e}")
             pass
         return None
 
+    def _get_pid_map(self) -> Dict[int, str]:
+        """Map emulator pids to instance names, rebuilt when the instance set changes"""
+        version = self.emulator_manager.instances_version
+        if self._pid_map_version != version:
+            self._pid_to_instance = {
+                instance.pid: instance.name
+                for instance in list(self.emulator_manager.instances.values())
+                if instance.pid
+            }
+            self._pid_map_version = version
+        return self._pid_to_instance
+
+    def _get_psutil_proc(self, instance: EmulatorInstance):
+        """Get the cached psutil.Process for an instance, recreating it if the pid changed"""
+        proc = self._psutil_proc.get(instance.name)
+        if proc is None or proc.pid != instance.pid:
+            proc = psutil.Process(instance.pid)
+            self._psutil_proc[instance.name] = proc
+        return proc
+
+    def _prime_psutil_proc(self, instance_name: str):
+        """Cache the psutil.Process for a synced instance ahead of the first input"""
+        if not _HAVE_PSUTIL:
+            return
+        instance = self.emulator_manager.get_instance(instance_name)
+        if not instance or not instance.pid:
+            return
+        try:
+            self._get_psutil_proc(instance)
+        except Exception:
+            self._psutil_proc.pop(instance_name, None)
+
+    def _get_child_map(self) -> Optional[Dict[int, List[int]]]:
+        """Get a ppid -> child pids index of the process table
+        
+        Built from one ppid_map() snapshot (the same table Process.children()
+        rebuilds on every call) and reused for CHILD_MAP_TTL seconds. Returns
+        None if this psutil build does not expose ppid_map.
+        """
+        now = time.monotonic()
+        if self._child_map is not None and now - self._child_map_time < self.CHILD_MAP_TTL:
+            return self._child_map
+        
+        ppid_map = getattr(psutil._psplatform, "ppid_map", None)
+        if ppid_map is None:
+            return None
+        
+        child_map: Dict[int, List[int]] = {}
+        for child_pid, parent_pid in ppid_map().items():
+            if child_pid != parent_pid:
+                child_map.setdefault(parent_pid, []).append(child_pid)
+        self._child_map = child_map
+        self._child_map_time = now
+        return child_map
+
     def _on_click(self, x, y, button, pressed):
-        """Handle mouse click and release for tap/swipe detection"""
+        """Handle mouse click and release for tap/swipe detection
+        
+        This runs on the low-level mouse hook thread, where slow work stalls
+        input system-wide, so only the foreground window is captured here;
+        resolving its instance and geometry is left to the worker.
+        """
         if not self.sync_enabled:
             return
-            
-        try:
-            if pressed:
-                # Track start of potential swipe
-                instance_name = self._get_active_instance_name()
-                if not instance_name or instance_name not in self.synced_instances:
-                    return
-                self.last_press_info[button] = {
-                    'pos': (x, y),
-                    'timestamp': time.time(),
-                    'instance': instance_name
-                }
-            else:
-                # Handle release (detect if it was a tap or swipe)
-                if button not in self.last_press_info:
-                    return
-                
-                press_data = self.last_press_info.pop(button)
-                start_x, start_y = press_data['pos']
-                instance_name = press_data['instance']
-                
-                # Check if we are still in the same instance
-                current_instance = self._get_active_instance_name()
-                if current_instance != instance_name:
-                    return
-                
-                # Get window geometry to calculate relative position
-                hwnd = get_foreground_window()
-                rect = get_window_rect(hwnd)
-                
-                title_bar_height = 30 
-                border_width = 8
-                
-                def to_rel(raw_x, raw_y):
-                    rel_x = raw_x - rect.left - border_width
-                    rel_y = raw_y - rect.top - title_bar_height
-                    return rel_x, rel_y
+        hwnd = get_foreground_window()
+        self.action_queue.put(('raw_press' if pressed else 'raw_release', (x, y, button, time.time(), hwnd)))
 
-                start_rel_x, start_rel_y = to_rel(start_x, start_y)
-                end_rel_x, end_rel_y = to_rel(x, y)
-                
-                # Validation
-                win_w = rect.right - rect.left - (border_width * 2)
-                win_h = rect.bottom - rect.top - title_bar_height - border_width
-                
-                # Scale coordinates
-                res = self._get_device_resolution(instance_name)
-                if not res: return
-                
-                scale_x = res.width / win_w
-                scale_y = res.height / win_h
-                
-                s_x, s_y = start_rel_x * scale_x, start_rel_y * scale_y
-                e_x, e_y = end_rel_x * scale_x, end_rel_y * scale_y
-                
-                # Distinguish tap vs swipe (e.g. > 15 pixels movement)
-                dist = ((e_x - s_x)**2 + (e_y - s_y)**2)**0.5
-                if dist > 15:
-                    duration_ms = max(100, int((time.time() - press_data['timestamp']) * 1000))
-                    self.action_queue.put(('swipe', (s_x, s_y, e_x, e_y, duration_ms, instance_name)))
-                else:
-                    # It's a tap
-                    # Note: Use start coordinates for tap to avoid slight jitter on click
-                    self.action_queue.put(('touch', (s_x, s_y, instance_name)))
-        except Exception:
-            pass
+    def _handle_press(self, x, y, button, timestamp, hwnd):
+        """Track the start of a potential tap or swipe (worker thread)"""
+        instance_name = self._get_window_instance(hwnd)
+        if not instance_name or instance_name not in self.synced_instances:
+            return
+        self.last_press_info[button] = {
+            'pos': (x, y),
+            'timestamp': timestamp,
+            'instance': instance_name
+        }
+
+    def _handle_release(self, x, y, button, timestamp, hwnd):
+        """Turn a press/release pair into a tap or swipe (worker thread)"""
+        if button not in self.last_press_info:
+            return
+        
+        press_data = self.last_press_info.pop(button)
+        start_x, start_y = press_data['pos']
+        instance_name = press_data['instance']
+        
+        # Check if the release happened over the same, still synced, instance
+        if instance_name not in self.synced_instances or self._get_window_instance(hwnd) != instance_name:
+            return
+        
+        # Get window geometry to calculate relative position
+        ox, oy, win_w, win_h = self._get_window_geometry(hwnd)
+        if win_w <= 0 or win_h <= 0:
+            return
+        
+        # Scale coordinates
+        res = self._get_device_resolution(instance_name)
+        if not res: return
+        
+        s_x = (start_x - ox) * res.width // win_w
+        s_y = (start_y - oy) * res.height // win_h
+        e_x = (x - ox) * res.width // win_w
+        e_y = (y - oy) * res.height // win_h
+        
+        # Distinguish tap vs swipe (e.g. > 15 pixels movement)
+        dx, dy = e_x - s_x, e_y - s_y
+        if dx * dx + dy * dy > 15 * 15:
+            duration_ms = max(100, int((timestamp - press_data['timestamp']) * 1000))
+            self._send_swipe_batch(s_x, s_y, e_x, e_y, duration_ms, instance_name)
+        else:
+            # It's a tap
+            # Note: Use start coordinates for tap to avoid slight jitter on click
+            self._send_touch_batch(s_x, s_y, instance_name)
 
     def _on_key_release(self, key):
-        """Handle key release"""
+        """Handle key release
+        
+        Like _on_click this runs on a low-level hook thread, so only the
+        keycode and foreground window are captured; the worker resolves the
+        instance.
+        """
         if not self.sync_enabled:
             return
             
         try:
-            instance_name = self._get_active_instance_name()
-            if not instance_name or instance_name not in self.synced_instances:
-                return
-            
             if hasattr(key, 'char'):
                 char = key.char
                 # Convert char to basic keycode if possible, or send as text
                 # For simplicity, we'll try to map common keys
                 keycode = self.get_keycode_from_key(char)
-                if keycode:
-                    self.action_queue.put(('key', (keycode, instance_name)))
             else:
                 # Special keys
                 key_name = key.name.upper()
                 keycode = self.get_keycode_from_key(key_name)
-                if keycode:
-                    self.action_queue.put(('key', (keycode, instance_name)))
+            if keycode:
+                self.action_queue.put(('key', (keycode, get_foreground_window())))
         except:
             pass
 
+    def _handle_key(self, keycode: int, hwnd: int):
+        """Send a key released over a synced instance to the others (worker thread)"""
+        instance_name = self._get_window_instance(hwnd)
+        if not instance_name or instance_name not in self.synced_instances:
+            return
+        self._send_key_batch(keycode, instance_name)
+
     def _process_queue(self):
         """Process actions in background thread"""
         while True:
             try:
-                action_type, args = self.action_queue.get()
+                action = self.action_queue.get()
+                if action is self._stop_sentinel:
+                    if self._shutting_down:
+                        return
+                    continue
+                if not self.sync_enabled:
+                    continue
                 
-                if action_type == 'touch':
-                    x, y, source_instance = args
-                    self._send_touch_batch(x, y, source_instance)
-                elif action_type == 'swipe':
-                    sx, sy, ex, ey, duration, source_instance = args
-                    self._send_swipe_batch(sx, sy, ex, ey, duration, source_instance)
+                # Each handler checks the source instance is still synced
+                action_type, args = action
+                if action_type == 'raw_press':
+                    self._handle_press(*args)
+                elif action_type == 'raw_release':
+                    self._handle_release(*args)
                 elif action_type == 'key':
-                    keycode, source_instance = args
-                    self._send_key_batch(keycode, source_instance)
-                    
-                self.action_queue.task_done()
+                    self._handle_key(*args)
             except Exception as e:
                 # Reduce log spam
                 # print(f"Sync worker error: {e}") 
@@ -296,7 +818,7 @@ class InputSynchronizer:
                 capture_output=True, text=True, timeout=1
             )
             # Output: "Physical size: 1080x2400"
-            match = re.search(r"size: (\d+)x(\d+)", result.stdout)
+            match = _SIZE_RE.search(result.stdout)
             if match:
                 w, h = int(match.group(1)), int(match.group(2))
                 res = DeviceResolution(w, h)
@@ -306,82 +828,218 @@ class InputSynchronizer:
             pass
         return None
 
-    def _send_adb_cmd(self, device_id: str, cmd_args: List[str], delay_ms: float = 0):
-        """Helper to send a single ADB command with optional delay"""
-        try:
-            adb_path = self.config.adb_path
-            subprocess.run(
-                [adb_path, "-s", device_id, "shell"] + cmd_args,
-                capture_output=True, timeout=1
+    def _get_adb_shell(self, device_id: str) -> subprocess.Popen:
+        """Get the persistent shell for a device, starting it if needed (lock held)"""
+        proc = self._adb_shells.get(device_id)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                [self.config.adb_path, "-s", device_id, "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
-            if delay_ms > 0:
-                time.sleep(delay_ms)
+            self._adb_shells[device_id] = proc
+        return proc
+
+    def _close_adb_shells(self):
+        """Exit all persistent device shells"""
+        with self._adb_shells_lock:
+            shells = list(self._adb_shells.values())
+            self._adb_shells.clear()
+        
+        for proc in shells:
+            try:
+                proc.stdin.write(b"exit\n")
+                proc.stdin.close()
+            except OSError:
+                pass
+        for proc in shells:
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    def _write_to_shell(self, device_id: str, line: bytes):
+        """Write a single newline-terminated command to a device's persistent shell"""
+        try:
+            # Only the scheduler sends, but disable_sync may be closing shells
+            with self._adb_shells_lock:
+                # Checked under the lock so a shell is never spawned after
+                # _close_adb_shells has run; nothing would close it
+                if not self.sync_enabled or self._shutting_down:
+                    return
+                try:
+                    self._get_adb_shell(device_id).stdin.write(line)
+                except OSError:
+                    # Shell died (e.g. emulator restarted); reopen once and retry
+                    self._adb_shells.pop(device_id, None)
+                    self._get_adb_shell(device_id).stdin.write(line)
         except Exception:
             pass
 
-    def _send_touch_batch(self, x: float, y: float, exclude_instance: str):
-        """Send touch to all synced instances in parallel"""
-        if not self.executor: return
-        
-        delay_ms = self.config.get('input_sync.delay_ms', 0) / 1000.0
+    def _open_minitouch(self, instance_name: str):
+        """Connect to the instance's minitouch server, if it runs one (prefetch thread)"""
+        instance = self.emulator_manager.get_instance(instance_name)
+        if not instance or not instance.device_id:
+            return
+        device_id = instance.device_id
+        with self._minitouch_lock:
+            if device_id in self._minitouch:
+                return
+            # Reserve the slot; taps use the shell until the probe finishes
+            self._minitouch[device_id] = None
+            generation = self._minitouch_generation
         
+        conn = MinitouchConnection.open(self.config.adb_path, device_id)
+        if conn is None:
+            return
+        with self._minitouch_lock:
+            if generation == self._minitouch_generation:
+                self._minitouch[device_id] = conn
+                return
+        # Sync was turned off while connecting
+        conn.close(self.config.adb_path, device_id)
+
+    def _close_minitouch(self):
+        """Close all minitouch sockets"""
+        with self._minitouch_lock:
+            self._minitouch_generation += 1
+            connections = list(self._minitouch.items())
+            self._minitouch.clear()
+        for device_id, conn in connections:
+            if conn:
+                conn.close(self.config.adb_path, device_id)
+
+    def _minitouch_for(self, name: str, instance: EmulatorInstance):
+        """Return (connection, resolution) for a target, or None to use the shell"""
+        conn = self._minitouch.get(instance.device_id)
+        res = self.resolutions.get(name)
+        if conn and res:
+            return conn, res
+        return None
+
+    def _send_minitouch(self, device_id: str, conn: MinitouchConnection, commands: bytes) -> bool:
+        """Write to a minitouch socket, forgetting it if the write fails"""
+        try:
+            conn.send(commands)
+            return True
+        except OSError:
+            with self._minitouch_lock:
+                if self._minitouch.get(device_id) is conn:
+                    self._minitouch[device_id] = None
+            return False
+
+    def _synced_targets(self, exclude_instance: str) -> List[Tuple[str, EmulatorInstance]]:
+        """Synced instances with a device id, excluding the source"""
+        targets = []
         for name in list(self.synced_instances):
             if name == exclude_instance:
                 continue
-                
             instance = self.emulator_manager.get_instance(name)
-            if not instance or not instance.device_id:
-                continue
-            
-            self.executor.submit(self._send_adb_cmd, instance.device_id, ["input", "tap", str(int(x)), str(int(y))], delay_ms)
+            if instance and instance.device_id:
+                targets.append((name, instance))
+        return targets
 
-    def _send_swipe_batch(self, sx, sy, ex, ey, duration, exclude_instance: str):
-        """Send swipe to all synced instances in parallel"""
-        if not self.executor: return
+    def _stagger(self) -> Tuple[float, float]:
+        """Get (now, per-device delay) for scheduling a fan-out
         
-        delay_ms = self.config.get('input_sync.delay_ms', 0) / 1000.0
+        The configured sync delay is applied as a stagger between devices:
+        the n-th target is written n * delay after the first.
+        """
+        return time.monotonic(), self.config.get('input_sync.delay_ms', 0) / 1000.0
+
+    def _send_to_synced(self, line: bytes, exclude_instance: str):
+        """Write a command line to every synced instance except the source"""
+        now, delay = self._stagger()
+        for i, (_, instance) in enumerate(self._synced_targets(exclude_instance)):
+            self._scheduler.schedule(now + i * delay, self._write_to_shell, instance.device_id, line)
+
+    def _send_touch_or_shell(self, device_id: str, conn: MinitouchConnection, commands: bytes, line: bytes):
+        """Write minitouch commands, falling back to the shell line if the socket fails (scheduler thread)"""
+        if not self._send_minitouch(device_id, conn, commands):
+            self._write_to_shell(device_id, line)
+
+    def _send_touch_batch(self, x: float, y: float, exclude_instance: str):
+        """Send touch to all synced instances
         
-        for name in list(self.synced_instances):
-            if name == exclude_instance:
-                continue
-            instance = self.emulator_manager.get_instance(name)
-            if not instance or not instance.device_id:
-                continue
-            
-            cmd = ["input", "swipe", str(int(sx)), str(int(sy)), str(int(ex)), str(int(ey)), str(duration)]
-            self.executor.submit(self._send_adb_cmd, instance.device_id, cmd, delay_ms)
+        Devices with a minitouch socket get the tap directly; the rest go
+        through their persistent shell.
+        """
+        if not self.sync_enabled: return
+        x, y = int(x), int(y)
+        now, delay = self._stagger()
+        # Built once and written unchanged to every shell device
+        line = f"input tap {x} {y}\n".encode()
+        
+        for i, (name, instance) in enumerate(self._synced_targets(exclude_instance)):
+            deadline = now + i * delay
+            touch = self._minitouch_for(name, instance)
+            if touch:
+                conn, res = touch
+                mx, my = conn.scale(x, y, res)
+                commands = f"d 0 {mx} {my} {conn.pressure}\nc\nu 0\nc\n".encode()
+                # Contact 0 may still be held by a swipe being played out
+                deadline = max(deadline, self._touch_busy_until.get(instance.device_id, 0.0))
+                self._touch_busy_until[instance.device_id] = deadline
+                self._scheduler.schedule(deadline, self._send_touch_or_shell, instance.device_id, conn, commands, line)
+            else:
+                self._scheduler.schedule(deadline, self._write_to_shell, instance.device_id, line)
 
-    def _send_key_batch(self, keycode: int, exclude_instance: str):
-        """Send key to all synced instances in parallel"""
-        if not self.executor: return
+    def _send_swipe_batch(self, sx, sy, ex, ey, duration, exclude_instance: str):
+        """Send swipe to all synced instances
         
-        delay_ms = self.config.get('input_sync.delay_ms', 0) / 1000.0
+        Shell devices get a single "input swipe". minitouch devices get move
+        frames interpolated over the duration, scheduled one frame at a time
+        so a long drag never holds up the worker.
+        """
+        if not self.sync_enabled: return
+        sx, sy, ex, ey = int(sx), int(sy), int(ex), int(ey)
+        line = f"input swipe {sx} {sy} {ex} {ey} {duration}\n".encode()
         
-        for name in list(self.synced_instances):
-            if name == exclude_instance:
-                continue
-            instance = self.emulator_manager.get_instance(name)
-            if not instance or not instance.device_id:
+        now, delay = self._stagger()
+        frame = self.MINITOUCH_FRAME_MS / 1000.0
+        steps = max(1, duration // self.MINITOUCH_FRAME_MS)
+        points = [(sx + (ex - sx) * i // steps, sy + (ey - sy) * i // steps) for i in range(steps + 1)]
+        
+        for i, (name, instance) in enumerate(self._synced_targets(exclude_instance)):
+            device_id = instance.device_id
+            start = now + i * delay
+            touch = self._minitouch_for(name, instance)
+            if not touch:
+                # Returns immediately; the device's shell plays out the swipe
+                self._scheduler.schedule(start, self._write_to_shell, device_id, line)
                 continue
             
-            self.executor.submit(self._send_adb_cmd, instance.device_id, ["input", "keyevent", str(keycode)], delay_ms)
+            conn, res = touch
+            start = max(start, self._touch_busy_until.get(device_id, 0.0))
+            for j, (x, y) in enumerate(points):
+                mx, my = conn.scale(x, y, res)
+                if j == 0:
+                    self._scheduler.schedule(
+                        start, self._send_touch_or_shell, device_id, conn,
+                        f"d 0 {mx} {my} {conn.pressure}\nc\n".encode(), line
+                    )
+                else:
+                    self._scheduler.schedule(
+                        start + j * frame, self._send_swipe_frame, device_id, conn,
+                        f"m 0 {mx} {my} {conn.pressure}\nc\n".encode()
+                    )
+            end = start + steps * frame
+            self._scheduler.schedule(end, self._send_swipe_frame, device_id, conn, b"u 0\nc\n")
+            self._touch_busy_until[device_id] = end
+
+    def _send_swipe_frame(self, device_id: str, conn: MinitouchConnection, commands: bytes):
+        """Write one frame of a swipe, unless its connection has failed (scheduler thread)"""
+        if self._minitouch.get(device_id) is conn:
+            self._send_minitouch(device_id, conn, commands)
+
+    def _send_key_batch(self, keycode: int, exclude_instance: str):
+        """Send key to all synced instances"""
+        if not self.sync_enabled: return
+        self._send_to_synced(f"input keyevent {keycode}\n".encode(), exclude_instance)
 
     def get_keycode_from_key(self, key: str) -> Optional[int]:
         """Convert key name/char to Android keycode"""
-        keycode_map = {
-            # Numbers
-            '0': 7, '1': 8, '2': 9, '3': 10, '4': 11,
-            '5': 12, '6': 13, '7': 14, '8': 15, '9': 16,
-            # Letters
-            'a': 29, 'b': 30, 'c': 31, 'd': 32, 'e': 33,
-            'f': 34, 'g': 35, 'h': 36, 'i': 37, 'j': 38,
-            'k': 39, 'l': 40, 'm': 41, 'n': 42, 'o': 43,
-            'p': 44, 'q': 45, 'r': 46, 's': 47, 't': 48,
-            'u': 49, 'v': 50, 'w': 51, 'x': 52, 'y': 53, 'z': 54,
-            # Special keys
-            'ENTER': 66, 'BACKSPACE': 67, 'SPACE': 62,
-            'HOME': 3, 'BACK': 4, 'MENU': 82,
-            'ESC': 111,
-            'UP': 19, 'DOWN': 20, 'LEFT': 21, 'RIGHT': 22,
-        }
-        return keycode_map.get(key.lower() if len(key) == 1 else key.upper())
+        return _KEYCODE_MAP.get(key)
@@ -1,16 +1,19 @@
 """Logging module for the application"""
 
 import logging
+import logging.handlers
 import sys
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
 class LogEmitter(QObject):
     """Detached signal emitter for logging"""
-    log_message = pyqtSignal(str, str)  # message, level
+    log_ready = pyqtSignal()  # records are waiting in QtLogHandler.drain()
 
 
 class QtLogHandler(logging.Handler):
@@ -18,30 +21,49 @@ class QtLogHandler(logging.Handler):
     Custom logging handler that uses a detached QObject emitter.
     This prevents "wrapped C/C++ object deleted" errors during shutdown
     because we check if the emitter still exists before signaling.
+    
+    Records are buffered and log_ready is only emitted when the buffer goes
+    from empty to non-empty, so a burst costs one queued signal; the
+    receiver takes everything at once with drain().
     """
     
     def __init__(self):
         super().__init__()
-        self.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        # The log view has no timestamp column of its own, so keep a short one;
+        # the logger name never changes and is left to the file log
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
         self.emitter = LogEmitter()
         self._closed = False
+        self._buf = deque(maxlen=10000)  # (message, level)
+        self._buf_lock = threading.Lock()
     
     def emit(self, record):
-        """Emit log record as Qt signal"""
+        """Buffer the record and signal the UI if it was idle"""
         if self._closed or not self.emitter:
             return
             
         try:
             msg = self.format(record)
-            level = record.levelname
+            with self._buf_lock:
+                was_empty = not self._buf
+                self._buf.append((msg, record.levelname))
+            if not was_empty:
+                return
             # Check if C++ object still exists
             try:
-                self.emitter.log_message.emit(msg, level)
+                self.emitter.log_ready.emit()
             except (RuntimeError, AttributeError):
                 self._closed = True
         except Exception:
             pass
     
+    def drain(self) -> List[Tuple[str, str]]:
+        """Take all buffered (message, level) pairs"""
+        with self._buf_lock:
+            items = list(self._buf)
+            self._buf.clear()
+        return items
+    
     def close(self):
         """Close the handler"""
         self._closed = True
@@ -83,12 +105,18 @@ class AppLogger:
         log_dir.mkdir(exist_ok=True)
         log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        file_target = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
         )
-        file_handler.setFormatter(file_formatter)
+        file_target.setFormatter(file_formatter)
+        
+        # Buffer records and write them in batches; errors are written at once.
+        # logging.shutdown() flushes whatever is left at exit.
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_target
+        )
+        file_handler.setLevel(logging.DEBUG)
         self._logger.addHandler(file_handler)
         
         # Qt handler (for UI integration)
@@ -125,6 +153,12 @@ class AppLogger:
         self._logger.exception(message)
 
 
+_cached_logger: Optional[logging.Logger] = None
+
+
 def get_logger():
     """Get the application logger"""
-    return AppLogger().get_logger()
+    global _cached_logger
+    if _cached_logger is None:
+        _cached_logger = AppLogger().get_logger()
+    return _cached_logger